@@ -1,8 +1,10 @@
 """Redundancy detection for identifying duplicate projects."""
 
+import zlib
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import lru_cache
+from itertools import combinations
 from typing import Any
 
 import numpy as np
@@ -11,6 +13,19 @@ from globallm.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# MinHash parameters for README candidate generation
+MINHASH_PERMUTATIONS = 128
+_MINHASH_RNG = np.random.default_rng(0x5EED)
+_MINHASH_A = _MINHASH_RNG.integers(
+    0, 2**64 - 1, MINHASH_PERMUTATIONS, dtype=np.uint64, endpoint=True
+) | np.uint64(1)
+_MINHASH_B = _MINHASH_RNG.integers(
+    0, 2**64 - 1, MINHASH_PERMUTATIONS, dtype=np.uint64, endpoint=True
+)
+# Candidates whose signature agreement is more than four worst-case
+# standard errors (sqrt(0.25 / permutations)) below the threshold are dropped
+_MINHASH_MARGIN = 4 * (0.25 / MINHASH_PERMUTATIONS) ** 0.5
+
 
 class RedundancyReason(Enum):
     """Reason for redundancy flag."""
@@ -129,27 +144,115 @@ class RedundancyDetector:
             emb_a = embedder.encode(readme_a, convert_to_numpy=True)
             emb_b = embedder.encode(readme_b, convert_to_numpy=True)
 
-            # Cosine similarity
-            similarity = np.dot(emb_a, emb_b) / (
-                np.linalg.norm(emb_a) * np.linalg.norm(emb_b)
-            )
-            return float(similarity)
+            return _cosine(emb_a, emb_b)
         except Exception as e:
             logger.warning("embedding_failed", error=str(e))
             return self._word_overlap_similarity(readme_a, readme_b)
 
+    def readme_pair_similarities(
+        self, readmes: list[str], pairs: list[tuple[int, int]]
+    ) -> list[float]:
+        """Compute README similarity for many pairs at once.
+
+        Equivalent to calling compute_readme_similarity on each pair, but
+        every README is embedded (or split into words) a single time, no
+        matter how many pairs it appears in.
+
+        Args:
+            readmes: README texts
+            pairs: (i, j) index pairs into readmes
+
+        Returns:
+            Similarity score 0-1 for each pair, in order
+        """
+        indices = sorted({i for pair in pairs for i in pair if readmes[i]})
+        if not indices:
+            return [0.0] * len(pairs)
+
+        embedder = self.embedder
+        if embedder is not False:
+            try:
+                embeddings = embedder.encode(
+                    [readmes[i] for i in indices], convert_to_numpy=True
+                )
+                return _pair_cosines(embeddings, indices, pairs)
+            except Exception as e:
+                logger.warning("embedding_failed", error=str(e))
+
+        words = {i: _word_ids(readmes[i]) for i in indices}
+        return [
+            _jaccard(words[i], words[j]) if i in words and j in words else 0.0
+            for i, j in pairs
+        ]
+
     def _word_overlap_similarity(self, text_a: str, text_b: str) -> float:
         """Fallback similarity using word overlap."""
-        words_a = set(text_a.lower().split())
-        words_b = set(text_b.lower().split())
+        return _jaccard(_word_ids(text_a), _word_ids(text_b))
 
-        if not words_a or not words_b:
-            return 0.0
+    def candidate_pairs(
+        self, readmes: list[str], threshold: float
+    ) -> list[tuple[int, int]]:
+        """Find README pairs worth an exact similarity check.
+
+        With the word-overlap fallback, pairs are generated with MinHash
+        LSH so that only READMEs likely to reach the threshold are compared.
+        Embedding similarity is not bounded by word overlap, so every pair
+        is returned when an embedder is available (or the threshold is zero).
+
+        Args:
+            readmes: README texts, indexed like the caller's repo list
+            threshold: Similarity threshold the caller will apply
 
-        intersection = words_a & words_b
-        union = words_a | words_b
+        Returns:
+            Sorted (i, j) index pairs with i < j
+        """
+        indices = [i for i, readme in enumerate(readmes) if readme]
+        if len(indices) < 2:
+            return []
 
-        return len(intersection) / len(union) if union else 0.0
+        if self.embedder is not False or threshold <= 0:
+            return list(combinations(indices, 2))
+
+        signatures = {i: _minhash_signature(readmes[i]) for i in indices}
+        rows = _lsh_rows_per_band(threshold)
+        bands = MINHASH_PERMUTATIONS // rows
+
+        banded: set[tuple[int, int]] = set()
+        for band in range(bands):
+            buckets: dict[bytes, list[int]] = {}
+            for i, signature in signatures.items():
+                key = signature[band * rows : (band + 1) * rows].tobytes()
+                buckets.setdefault(key, []).append(i)
+            for bucket in buckets.values():
+                banded.update(combinations(bucket, 2))
+        # Jaccard similarity cannot exceed min(|A|, |B|) / max(|A|, |B|), so
+        # pairs whose word sets differ too much in size are dropped exactly
+        sizes = {i: len(_word_ids(readmes[i])) for i in indices}
+        pairs = [
+            (i, j)
+            for i, j in sorted(banded)
+            if min(sizes[i], sizes[j]) >= threshold * max(sizes[i], sizes[j])
+        ]
+        if not pairs:
+            return []
+
+        # Banding is tuned for recall, so it lets through pairs well below
+        # the threshold. The fraction of agreeing signature slots is an
+        # unbiased Jaccard estimate; drop pairs clearly under the threshold.
+        left = np.array([signatures[i] for i, _ in pairs])
+        right = np.array([signatures[j] for _, j in pairs])
+        estimates = (left == right).mean(axis=1)
+        keep = estimates >= threshold - _MINHASH_MARGIN
+        candidates = [pair for pair, kept in zip(pairs, keep) if kept]
+
+        logger.debug(
+            "readme_candidate_pairs",
+            readmes=len(indices),
+            banded=len(banded),
+            candidates=len(candidates),
+            rows_per_band=rows,
+        )
+        return candidates
 
     def compare_api_signatures(self, sig_a: APISignature, sig_b: APISignature) -> float:
         """Compare two API signatures.
@@ -359,6 +462,84 @@ class RedundancyDetector:
         return "\n".join(lines)
 
 
+@lru_cache(maxsize=256)
+def _word_ids(text: str) -> np.ndarray:
+    """Hash a text's lowercased words to a sorted array of unique uint32 ids.
+
+    Cached per text, so the candidate search and the similarity scoring
+    tokenize each README only once. The returned array is read-only.
+    """
+    words = set(text.lower().split())
+    ids = np.unique(
+        np.fromiter(
+            (zlib.crc32(word.encode()) for word in words),
+            dtype=np.uint32,
+            count=len(words),
+        )
+    )
+    ids.flags.writeable = False
+    return ids
+
+
+def _jaccard(ids_a: np.ndarray, ids_b: np.ndarray) -> float:
+    """Jaccard similarity of two sorted id sets; 0 when either is empty."""
+    if not ids_a.size or not ids_b.size:
+        return 0.0
+    intersection = np.intersect1d(ids_a, ids_b, assume_unique=True).size
+    return intersection / (ids_a.size + ids_b.size - intersection)
+
+
+def _cosine(vec_a: np.ndarray, vec_b: np.ndarray) -> float:
+    """Cosine similarity of two vectors."""
+    return float(np.dot(vec_a, vec_b) / (np.linalg.norm(vec_a) * np.linalg.norm(vec_b)))
+
+
+def _pair_cosines(
+    embeddings: np.ndarray, indices: list[int], pairs: list[tuple[int, int]]
+) -> list[float]:
+    """Cosine similarity for many pairs from a single matrix product.
+
+    Row ``k`` of ``embeddings`` belongs to ``indices[k]``; pairs involving
+    an index without a row score 0.
+    """
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    unit = embeddings / np.where(norms == 0, 1, norms)
+    similarity = unit @ unit.T
+
+    position = {index: row for row, index in enumerate(indices)}
+    rows = np.array([(position.get(i, -1), position.get(j, -1)) for i, j in pairs])
+    scores = similarity[rows[:, 0], rows[:, 1]]
+    scores[(rows < 0).any(axis=1)] = 0.0
+    return scores.tolist()
+
+
+def _minhash_signature(text: str) -> np.ndarray:
+    """Compute the MinHash signature of a text's lowercased word set."""
+    tokens = _word_ids(text).astype(np.uint64)
+    if not tokens.size:
+        return np.zeros(MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+    # Multiply-add-shift hashing (wrapping mod 2**64), one row per permutation
+    hashes = (_MINHASH_A[:, None] * tokens[None, :] + _MINHASH_B[:, None]) >> 32
+    return hashes.min(axis=1)
+
+
+@lru_cache(maxsize=32)
+def _lsh_rows_per_band(threshold: float, recall: float = 0.99) -> int:
+    """Pick the most selective LSH band width that keeps pairs at threshold.
+
+    A pair with Jaccard similarity ``t`` shares at least one band with
+    probability ``1 - (1 - t**r) ** b``; choose the largest ``r`` for which
+    that stays at or above ``recall``.
+    """
+    best = 1
+    for rows in range(1, MINHASH_PERMUTATIONS + 1):
+        bands = MINHASH_PERMUTATIONS // rows
+        if 1 - (1 - threshold**rows) ** bands >= recall:
+            best = rows
+    return best
+
+
 @lru_cache(maxsize=1024)
 def extract_api_signature(file_contents: dict[str, str], language: str) -> APISignature:
     """Extract API signature from file contents.
@@ -313,7 +313,7 @@ Once all CI checks pass, this PR can be automatically merged.
         Returns:
             Final CI status report
         """
-        repo = self.github.get_repo(repo_name)
+        repo = self.github.withLazy(True).get_repo(repo_name)
         pr = repo.get_pull(pr_number)
 
         return self.ci_monitor.wait_for_ci(
@@ -343,7 +343,7 @@ Once all CI checks pass, this PR can be automatically merged.
             get_remédiation_actions,
         )
 
-        repo = self.github.get_repo(repo_name)
+        repo = self.github.withLazy(True).get_repo(repo_name)
         pr = repo.get_pull(pr_number)
 
         failures = analyze_failure(failure_report)
@@ -452,7 +452,7 @@ Please fix the issues and push a new commit.
         Returns:
             PR info dict
         """
-        repo = self.github.get_repo(repo_name)
+        repo = self.github.withLazy(True).get_repo(repo_name)
         pr = repo.get_pull(pr_number)
 
         return {
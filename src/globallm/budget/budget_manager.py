@@ -1,5 +1,6 @@
 """Budget management and enforcement."""
 
+import heapq
 from dataclasses import dataclass
 
 from globallm.budget.state import BudgetState
@@ -75,6 +76,11 @@ class BudgetManager:
         self.state = state or BudgetState.load()
         self.estimator = estimator or TokenEstimator()
 
+        # Budget set aside for operations that have not run yet, per repo.
+        # Held in memory only; never saved with the usage state.
+        self._reserved_tokens: dict[str, int] = {}
+        self._reserved_issues: dict[str, int] = {}
+
         # Sync limits with state
         if self.state.weekly_budget != self.limits.weekly_token_budget:
             self.state.weekly_budget = self.limits.weekly_token_budget
@@ -90,8 +96,70 @@ class BudgetManager:
         Returns:
             True if within budget
         """
+        if not self._check_repo_limits(repo, estimated_tokens):
+            return False
+
+        # Check weekly budget
+        if not self._check_weekly_budget(estimated_tokens):
+            return False
+
+        return True
+
+    def reserve(self, repo: str, estimated_tokens: int = 0) -> bool:
+        """Set aside budget for one issue in a repository, if it fits.
+
+        Reservations count against the limits in later checks on this
+        manager, so work dispatched together cannot overrun the budget.
+
+        Args:
+            repo: Repository name
+            estimated_tokens: Estimated tokens for the operation
+
+        Returns:
+            True if the budget was reserved
+        """
+        if not self.can_process_repo(repo, estimated_tokens):
+            return False
+        self._reserved_tokens[repo] = (
+            self._reserved_tokens.get(repo, 0) + estimated_tokens
+        )
+        self._reserved_issues[repo] = self._reserved_issues.get(repo, 0) + 1
+        return True
+
+    def filter_processable(
+        self, repos: list[str], estimated_tokens: int = 0
+    ) -> list[str]:
+        """Return the repositories that can be processed given budget.
+
+        Equivalent to calling ``can_process_repo`` for each repository, but
+        the weekly budget is checked once for the whole batch.
+
+        Args:
+            repos: Repository names
+            estimated_tokens: Estimated tokens per repository
+
+        Returns:
+            Processable repositories, in input order
+        """
+        if not self._check_weekly_budget(estimated_tokens):
+            return []
+        return [
+            repo for repo in repos if self._check_repo_limits(repo, estimated_tokens)
+        ]
+
+    def _check_repo_limits(self, repo: str, estimated_tokens: int) -> bool:
+        """Check per-repository token and issue limits.
+
+        Args:
+            repo: Repository name
+            estimated_tokens: Tokens to be used
+
+        Returns:
+            True if within the repository's limits
+        """
         # Check per-repo token limit
         repo_tokens = self.state.get_repo_tokens(repo)
+        repo_tokens += self._reserved_tokens.get(repo, 0)
         if repo_tokens + estimated_tokens > self.limits.max_tokens_per_repo:
             logger.info(
                 "repo_token_limit_exceeded",
@@ -104,6 +172,7 @@ class BudgetManager:
 
         # Check per-repo issue limit
         repo_issues = self.state.get_repo_issues(repo)
+        repo_issues += self._reserved_issues.get(repo, 0)
         if repo_issues >= self.limits.max_issues_per_repo:
             logger.info(
                 "repo_issue_limit_exceeded",
@@ -113,10 +182,6 @@ class BudgetManager:
             )
             return False
 
-        # Check weekly budget
-        if not self._check_weekly_budget(estimated_tokens):
-            return False
-
         return True
 
     def can_process_issue(
@@ -223,10 +288,11 @@ class BudgetManager:
         """
         self.state.check_and_reset_week()
 
-        if self.state.weekly_used + estimated_tokens > self.limits.weekly_token_budget:
+        weekly_used = self.state.weekly_used + sum(self._reserved_tokens.values())
+        if weekly_used + estimated_tokens > self.limits.weekly_token_budget:
             logger.info(
                 "weekly_budget_exceeded",
-                current=self.state.weekly_used,
+                current=weekly_used,
                 estimated=estimated_tokens,
                 limit=self.limits.weekly_token_budget,
             )
@@ -268,6 +334,23 @@ class BudgetManager:
             total_prs=self.state.total_prs_created,
         )
 
+    def get_top_repos(self, n: int = 10) -> list[tuple[str, dict[str, int]]]:
+        """Get the repositories with the highest token usage.
+
+        Args:
+            n: Number of repositories to return
+
+        Returns:
+            (repo, {"tokens", "issues"}) pairs, highest usage first
+        """
+        top = heapq.nlargest(
+            n, self.state.per_repo.items(), key=lambda item: item[1].tokens_used
+        )
+        return [
+            (repo, {"tokens": budget.tokens_used, "issues": budget.issues_processed})
+            for repo, budget in top
+        ]
+
     def reset_weekly(self) -> None:
         """Reset weekly budget tracking."""
         logger.info("resetting_weekly_budget")
@@ -0,0 +1,36 @@
+"""Command-line interface for GlobaLLM."""
+
+import os
+import sys
+
+
+def _print_version() -> None:
+    """Write the version to stdout."""
+    import contextlib  # noqa: PLC0415
+    import io  # noqa: PLC0415
+
+    from globallm.version import get_git_commit  # noqa: PLC0415
+
+    # Redirect stdout/stderr to suppress all logging output
+    with (
+        contextlib.redirect_stdout(io.StringIO()),
+        contextlib.redirect_stderr(io.StringIO()),
+    ):
+        version = get_git_commit() or "unknown"
+    # Write version directly to stdout fd to bypass any redirection
+    os.write(1, (version + "\n").encode())
+
+
+def main() -> None:
+    """Console entry point.
+
+    A bare ``--version`` is answered from argv before Typer is imported;
+    everything else is dispatched to the Typer app.
+    """
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        _print_version()
+        return
+
+    from globallm.cli.cli import app  # noqa: PLC0415
+
+    app()
@@ -1,14 +1,15 @@
 """Analyze command."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 import typer
 from rich import print as rprint
 
+from globallm.cli.common import _console, _fetch_all
+
 if TYPE_CHECKING:
     from globallm.scanner import RepoMetrics
-    from globallm.storage.repository_store import RepositoryStore
 
 app = typer.Typer(help="Analyze repositories")
 
@@ -19,16 +20,21 @@ def analyze(
         None,
         help="Repository name (owner/repo), or analyze all unanalyzed repositories if not specified",
     ),
-    include_dependents: bool = typer.Option(False, help="Include dependent analysis"),
+    cache_ttl: int = typer.Option(
+        24, help="Hours to reuse cached GitHub results (0 to refresh)"
+    ),
 ) -> None:
     """Analyze a repository or all unanalyzed repositories.
 
     The analysis automatically calculates whether the repository is worth working on
     and updates the repository store.
     """
+    from globallm.github import get_github_tokens  # noqa: PLC0415
+    from globallm.scanner import GitHubScanner  # noqa: PLC0415
     from globallm.storage.repository_store import RepositoryStore  # noqa: PLC0415
 
     store = RepositoryStore()
+    scanner = GitHubScanner.from_tokens(get_github_tokens(), cache_ttl_hours=cache_ttl)
 
     if repo is None:
         # Analyze all unanalyzed repositories
@@ -40,30 +46,63 @@ def analyze(
         rprint(
             f"[bold cyan]Found {len(unanalyzed)} unanalyzed repositories[/bold cyan]"
         )
-        for repo_dict in unanalyzed:
-            repo_name = repo_dict.get("name")
-            if repo_name:
-                _analyze_single(repo_name, store, rprint)
+        existing = {
+            name: repo_dict
+            for repo_dict in unanalyzed
+            if (name := repo_dict.get("name"))
+        }
+        names = list(existing)
+
+        def fetch_one(repo_name: str) -> RepoMetrics | Exception:
+            try:
+                return scanner.analyze_repo(repo_name)
+            except Exception as e:
+                return e
+
+        # Fetch concurrently, then score the batch and report in order
+        fetched = []
+        for repo_name, result in zip(names, _fetch_all(fetch_one, names)):
+            if isinstance(result, Exception):
+                rprint(
+                    f"[yellow]Warning: Could not analyze {repo_name}: {result}[/yellow]"
+                )
+            else:
+                fetched.append((repo_name, result))
+
+        scores = _calculate_scores([metrics for _, metrics in fetched])
+        records = [
+            _analyze_single(
+                repo_name, metrics, health, impact, existing[repo_name], _console.print
+            )
+            for (repo_name, metrics), (health, impact) in zip(fetched, scores)
+        ]
+        # One upsert batch for the whole run instead of a round trip per repo
+        store.add_or_update_many(records)
+        if records:
+            rprint(
+                f"\n[dim]→ Updated repository store ({len(records)} repositories)[/dim]"
+            )
     else:
-        _analyze_single(repo, store, rprint)
-
+        metrics = scanner.analyze_repo(repo)
+        [(health, impact)] = _calculate_scores([metrics])
+        record = _analyze_single(
+            repo, metrics, health, impact, store.get_repository(repo), _console.print
+        )
+        store.add_or_update(record)
+        rprint("\n[dim]→ Updated repository store[/dim]")
 
-def _analyze_single(repo: str, store: RepositoryStore, rprint: Callable) -> None:
-    """Analyze a single repository."""
-    from globallm.scanner import GitHubScanner
-    from globallm.github import create_github_client
-    import os
 
-    token = os.getenv("GITHUB_TOKEN")
+def _analyze_single(
+    repo: str,
+    metrics: RepoMetrics,
+    health_score: float,
+    impact_score: float,
+    existing: dict[str, Any] | None,
+    rprint: Callable,
+) -> dict[str, Any]:
+    """Display a repository's analysis and return its updated store record."""
     rprint(f"[bold cyan]Analyzing {repo}...[/bold cyan]")
 
-    scanner = GitHubScanner(create_github_client(token))
-    metrics = scanner.analyze_repo(repo)
-
-    # Calculate health and impact scores
-    health_score = _calculate_health_score(metrics)
-    impact_score = _calculate_impact_score(metrics)
-
     # Determine if worth working on
     worth_working_on = health_score > 0.5 and impact_score > 0.5
 
@@ -73,63 +112,61 @@ def _analyze_single(repo: str, store: RepositoryStore, rprint: Callable) -> None
     )
 
     # Display results
-    rprint("\n[bold]Repository Metrics[/bold]")
-    rprint(f"  Stars: {metrics.stars:,}")
-    rprint(f"  Forks: {metrics.forks:,}")
-    rprint(f"  Open issues: {metrics.open_issues:,}")
-    rprint(f"  Watchers: {metrics.watchers:,}")
-    rprint(f"  Language: {metrics.language or 'N/A'}")
-    rprint(f"  Score: {metrics.score:.1f}")
-
-    # Display analysis results
-    rprint("\n[bold]Analysis[/bold]")
     health_color = (
         "green" if health_score > 0.5 else "yellow" if health_score > 0.3 else "red"
     )
     impact_color = (
         "green" if impact_score > 0.5 else "yellow" if impact_score > 0.3 else "red"
     )
-    rprint(f"  Health Score: [{health_color}]{health_score:.1%}[/{health_color}]")
-    rprint(f"  Impact Score: [{impact_color}]{impact_score:.1%}[/{impact_color}]")
-
-    if worth_working_on:
-        rprint("  [green]✓ Worth working on[/green]")
-    else:
-        rprint("  [yellow]✗ Not recommended for contributions[/yellow]")
-
-    rprint(f"  [dim]Reason: {analysis_reason}[/dim]")
+    verdict = (
+        "  [green]✓ Worth working on[/green]"
+        if worth_working_on
+        else "  [yellow]✗ Not recommended for contributions[/yellow]"
+    )
+    rprint(
+        "\n".join(
+            [
+                "\n[bold]Repository Metrics[/bold]",
+                f"  Stars: {metrics.stars:,}",
+                f"  Forks: {metrics.forks:,}",
+                f"  Open issues: {metrics.open_issues:,}",
+                f"  Watchers: {metrics.watchers:,}",
+                f"  Language: {metrics.language or 'N/A'}",
+                f"  Score: {metrics.score:.1f}",
+                "\n[bold]Analysis[/bold]",
+                f"  Health Score: [{health_color}]{health_score:.1%}[/{health_color}]",
+                f"  Impact Score: [{impact_color}]{impact_score:.1%}[/{impact_color}]",
+                verdict,
+                f"  [dim]Reason: {analysis_reason}[/dim]",
+            ]
+        )
+    )
 
-    # Update repository store
-    _update_store(
-        store,
-        repo,
+    return _build_record(
+        existing,
         metrics,
         health_score,
         impact_score,
         worth_working_on,
         analysis_reason,
-        rprint,
     )
 
 
-def _calculate_health_score(metrics) -> float:
-    """Calculate health score from metrics (0-1)."""
-    # Normalize score to 0-1 range (assuming max score around 100000)
-    max_score = 100000
-    normalized = min(metrics.score / max_score, 1.0)
-    return normalized
-
+def _calculate_scores(metrics: list[RepoMetrics]) -> list[tuple[float, float]]:
+    """Calculate (health, impact) scores (0-1) for a batch of repositories."""
+    import numpy as np  # noqa: PLC0415
 
-def _calculate_impact_score(metrics) -> float:
-    """Calculate impact score from metrics (0-1)."""
-    # Impact based on stars, forks, watchers
-    # Normalize each component
-    stars_score = min(metrics.stars / 50000, 1.0)  # 50k stars = max
-    forks_score = min(metrics.forks / 10000, 1.0)  # 10k forks = max
-    watchers_score = min(metrics.watchers / 2000, 1.0)  # 2k watchers = max
+    values = np.array(
+        [(m.score, m.stars, m.forks, m.watchers) for m in metrics], dtype=float
+    ).reshape(-1, 4)
+    # Normalize each column, capping at 1: score (health) assumes a max
+    # around 100000; 50k stars, 10k forks and 2k watchers count as max
+    normalized = np.minimum(values / [100_000, 50_000, 10_000, 2_000], 1.0)
 
-    # Weighted average
-    return stars_score * 0.5 + forks_score * 0.3 + watchers_score * 0.2
+    health = normalized[:, 0]
+    # Impact is a weighted average of stars, forks and watchers
+    impact = normalized[:, 1:] @ [0.5, 0.3, 0.2]
+    return list(zip(health.tolist(), impact.tolist()))
 
 
 def _generate_analysis_reason(
@@ -150,37 +187,21 @@ def _generate_analysis_reason(
             return f"Moderate health ({health_pct}), moderate impact ({impact_pct})"
 
 
-def _update_store(
-    store: RepositoryStore,
-    repo_name: str,
+def _build_record(
+    existing: dict[str, Any] | None,
     metrics: RepoMetrics,
     health_score: float,
     impact_score: float,
     worth_working_on: bool,
     analysis_reason: str,
-    rprint: Callable,
-) -> None:
-    """Update the repository store with analysis results."""
-    # Get existing repo data
-    existing = store.get_repository(repo_name)
-
-    if existing:
-        # Update existing repo
-        existing.update(metrics.to_dict())
-        existing["health_score"] = health_score
-        existing["impact_score"] = impact_score
-        existing["worth_working_on"] = worth_working_on
-        existing["analyzed_at"] = datetime.now().isoformat()
-        existing["analysis_reason"] = analysis_reason
-        store.add_or_update(existing)
-    else:
-        # Create new entry
-        repo_dict = metrics.to_dict()
-        repo_dict["health_score"] = health_score
-        repo_dict["impact_score"] = impact_score
-        repo_dict["worth_working_on"] = worth_working_on
-        repo_dict["analyzed_at"] = datetime.now().isoformat()
-        repo_dict["analysis_reason"] = analysis_reason
-        store.add_or_update(repo_dict)
-
-    rprint("\n[dim]→ Updated repository store[/dim]")
+) -> dict[str, Any]:
+    """Merge analysis results into a repository's store record."""
+    # Update the existing repo data, or create a new entry
+    record = existing if existing is not None else {}
+    record.update(metrics.to_dict())
+    record["health_score"] = health_score
+    record["impact_score"] = impact_score
+    record["worth_working_on"] = worth_working_on
+    record["analyzed_at"] = datetime.now().isoformat()
+    record["analysis_reason"] = analysis_reason
+    return record
@@ -1,15 +1,9 @@
 """Assignment status and management commands."""
 
-from datetime import datetime
-
 import typer
-from psycopg.rows import dict_row
 from rich import print as rprint
 from rich.table import Table
 
-from globallm.storage.db import get_connection
-from globallm.storage.issue_store import IssueStore
-
 app = typer.Typer(name="assign", help="Manage issue assignments")
 
 
@@ -21,13 +15,20 @@ def status(
     ),
 ) -> None:
     """Show current issue assignments."""
+    from psycopg.rows import dict_row  # noqa: PLC0415
+
+    from globallm.storage.db import get_connection  # noqa: PLC0415
+
     with get_connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
+            # Format display columns server-side so rows print as fetched
             query = """
                 SELECT repository, number,
-                       data->>'title' as title,
-                       assigned_to, assigned_at, last_heartbeat_at,
-                       assignment_status,
+                       LEFT(data->>'title', 40) as title,
+                       assigned_to,
+                       to_char(assigned_at, 'HH24:MI') as assigned_hm,
+                       floor(EXTRACT(EPOCH FROM NOW() - last_heartbeat_at) / 60)::int
+                           as heartbeat_age_min,
                        data->>'priority' as priority
                 FROM issues
                 WHERE assignment_status = 'assigned'
@@ -59,22 +60,14 @@ def status(
         table.add_column("Priority", style="green")
 
         for a in assignments:
-            # Calculate heartbeat age
-            if a["last_heartbeat_at"]:
-                age = (
-                    datetime.now(a["last_heartbeat_at"].tzinfo) - a["last_heartbeat_at"]
-                ).seconds
-                heartbeat_age = f"{age // 60}m ago"
-            else:
-                heartbeat_age = "Never"
-
+            age = a["heartbeat_age_min"]
             table.add_row(
                 a["repository"],
                 str(a["number"]),
-                (a["title"] or "")[:40],
+                a["title"] or "",
                 a["assigned_to"] or "",
-                a["assigned_at"].strftime("%H:%M") if a["assigned_at"] else "",
-                heartbeat_age,
+                a["assigned_hm"] or "",
+                f"{age}m ago" if age is not None else "Never",
                 str(a["priority"] or "N/A"),
             )
 
@@ -86,6 +79,8 @@ def release(
     agent_id: str = typer.Argument(..., help="Agent ID to release assignments for"),
 ) -> None:
     """Release all assignments for an agent."""
+    from globallm.storage.db import get_connection  # noqa: PLC0415
+
     with get_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
@@ -111,6 +106,8 @@ def cleanup(
     timeout_minutes: int = typer.Option(30, help="Timeout in minutes"),
 ) -> None:
     """Release stale assignments."""
+    from globallm.storage.issue_store import IssueStore  # noqa: PLC0415
+
     issue_store = IssueStore()
     timeout_seconds = timeout_minutes * 60
 
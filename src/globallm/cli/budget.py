@@ -3,6 +3,8 @@
 import typer
 from rich import print as rprint
 
+from globallm.cli.common import _console
+
 app = typer.Typer(name="budget", help="Budget management")
 
 
@@ -14,29 +16,33 @@ def show() -> None:
     manager = BudgetManager()
     report = manager.get_report()
 
-    rprint("[bold cyan]Budget Status[/bold cyan]")
-    rprint("\n[bold]Weekly Budget:[/bold]")
-    rprint(f"  Budget: {report.weekly_budget:,} tokens")
-    rprint(f"  Used: {report.weekly_used:,} tokens ({report.weekly_percent:.1f}%)")
-    rprint(f"  Remaining: {report.weekly_remaining:,} tokens")
-
-    rprint("\n[bold]Totals:[/bold]")
-    rprint(f"  Total tokens: {report.total_tokens:,}")
-    rprint(f"  Issues processed: {report.total_issues}")
-    rprint(f"  PRs created: {report.total_prs}")
+    lines = [
+        "[bold cyan]Budget Status[/bold cyan]",
+        "\n[bold]Weekly Budget:[/bold]",
+        f"  Budget: {report.weekly_budget:,} tokens",
+        f"  Used: {report.weekly_used:,} tokens ({report.weekly_percent:.1f}%)",
+        f"  Remaining: {report.weekly_remaining:,} tokens",
+        "\n[bold]Totals:[/bold]",
+        f"  Total tokens: {report.total_tokens:,}",
+        f"  Issues processed: {report.total_issues}",
+        f"  PRs created: {report.total_prs}",
+    ]
 
     if report.per_repo:
-        rprint("\n[bold]Top Repositories by Token Usage:[/bold]")
-        sorted_repos = sorted(
-            report.per_repo.items(), key=lambda x: x[1]["tokens"], reverse=True
-        )[:10]
-        for repo, stats in sorted_repos:
-            rprint(f"  {repo}: {stats['tokens']:,} tokens, {stats['issues']} issues")
+        lines.append("\n[bold]Top Repositories by Token Usage:[/bold]")
+        for repo, stats in manager.get_top_repos(10):
+            lines.append(
+                f"  {repo}: {stats['tokens']:,} tokens, {stats['issues']} issues"
+            )
 
     if report.per_language:
-        rprint("\n[bold]By Language:[/bold]")
+        lines.append("\n[bold]By Language:[/bold]")
         for lang, stats in sorted(report.per_language.items()):
-            rprint(f"  {lang}: {stats['tokens']:,} tokens, {stats['issues']} issues")
+            lines.append(
+                f"  {lang}: {stats['tokens']:,} tokens, {stats['issues']} issues"
+            )
+
+    _console.print("\n".join(lines))
 
 
 @app.command()
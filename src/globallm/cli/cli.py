@@ -1,22 +1,109 @@
 """CLI for GlobaLLM."""
 
+import functools
 import logging
+import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from dotenv import load_dotenv
+from typer.core import TyperCommand, TyperGroup
 
-from globallm.version import get_git_commit  # noqa: PLC0415
+from globallm.cli import _print_version
 
+if TYPE_CHECKING:
+    import click
 
-def _version_callback() -> str:
-    """Get version string."""
-    commit = get_git_commit()
-    return commit if commit else "unknown"
+
+# Subcommands: name -> (module, help, rich help panel). The listing is
+# static so --help can be rendered without importing any command module;
+# a module is imported only when its command is actually invoked.
+_COMMAND_GROUPS = "Command Groups"
+_COMMANDS: dict[str, tuple[str, str, str | None]] = {
+    "discover": (
+        "globallm.cli.discover",
+        "Discover repositories by domain and language.",
+        None,
+    ),
+    "analyze": (
+        "globallm.cli.analyze",
+        "Analyze a repository or all unanalyzed repositories.",
+        None,
+    ),
+    "prioritize": (
+        "globallm.cli.prioritize",
+        "Prioritize issues across approved repositories.",
+        None,
+    ),
+    "fix": ("globallm.cli.fix", "Analyze an issue and generate a fix.", None),
+    "issues": (
+        "globallm.cli.issues",
+        "Fetch and list issues from a repository.",
+        None,
+    ),
+    "redundancy": (
+        "globallm.cli.redundancy",
+        "Detect redundancy between repositories.",
+        None,
+    ),
+    "status": ("globallm.cli.status", "Show system status and statistics.", None),
+    "analyze-user": (
+        "globallm.cli.user",
+        "Analyze all repositories owned by a user.",
+        None,
+    ),
+    "assign": ("globallm.cli.assign", "Manage issue assignments", _COMMAND_GROUPS),
+    "budget": ("globallm.cli.budget", "Budget management", _COMMAND_GROUPS),
+    "config": ("globallm.cli.config", "Configuration management", _COMMAND_GROUPS),
+    "database": (
+        "globallm.cli.database",
+        "Database management commands",
+        _COMMAND_GROUPS,
+    ),
+    "repos": ("globallm.cli.repos", "Manage stored repositories", _COMMAND_GROUPS),
+}
+
+
+class _LazyGroup(TyperGroup):
+    """Root group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return [*_COMMANDS, *super().list_commands(ctx)]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> click.Command | None:
+        """Return a help-only stub for subcommands that are not loaded yet."""
+        if cmd_name in self.commands or cmd_name not in _COMMANDS:
+            return super().get_command(ctx, cmd_name)
+        _, help_text, panel = _COMMANDS[cmd_name]
+        return TyperCommand(cmd_name, help=help_text, rich_help_panel=panel)
+
+    def resolve_command(
+        self, ctx: typer.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        cmd_name, cmd, args = super().resolve_command(ctx, args)
+        if cmd_name in _COMMANDS and cmd_name not in self.commands:
+            cmd = self._load(cmd_name)
+        return cmd_name, cmd, args
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Import a subcommand module and register its command."""
+        import importlib  # noqa: PLC0415
+
+        module_name, _, panel = _COMMANDS[cmd_name]
+        module = importlib.import_module(module_name)
+        # Build through a parent app so the command is assembled exactly as
+        # add_typer() would register it on the root app
+        parent = typer.Typer(add_completion=False, rich_markup_mode="rich")
+        parent.add_typer(module.app, rich_help_panel=panel)
+        cmd = typer.main.get_group(parent).commands[cmd_name]
+        self.add_command(cmd, cmd_name)
+        return cmd
 
 
 app = typer.Typer(
     name="globallm",
+    cls=_LazyGroup,
     help="Scan GitHub to identify impactful libraries and contribute to their success",
     no_args_is_help=True,
     add_completion=False,
@@ -24,28 +111,34 @@ app = typer.Typer(
 )
 
 
-def config_callback(log_level: str) -> None:
+@dataclass(slots=True)
+class _CLIContext:
+    """State shared with subcommands through ``ctx.obj``."""
+
+    config_path: Path | None = None
+
+
+@functools.cache
+def _dotenv_path() -> str:
+    """Locate the .env file to load, or an empty string if there is none."""
+    from dotenv import find_dotenv  # noqa: PLC0415
+
+    return os.environ.get("GLOBALLM_ENV_FILE") or find_dotenv(usecwd=True)
+
+
+def _log_level_callback(log_level: str) -> str:
     """Configure logging based on log level."""
     from globallm.logging_config import configure_logging  # noqa: PLC0415
 
     level_int = getattr(logging, log_level.upper(), logging.INFO)
     configure_logging(level_int)
+    return log_level
 
 
 def _exit_with_version(value: bool) -> None:
     """Exit with version information."""
     if value:
-        import contextlib
-        import io
-        import os
-
-        # Redirect stdout/stderr to suppress all logging output
-        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(
-            io.StringIO()
-        ):
-            version = _version_callback()
-        # Write version directly to stdout fd to bypass any redirection
-        os.write(1, (version + "\n").encode())
+        _print_version()
         raise typer.Exit()
 
 
@@ -58,14 +151,14 @@ def main(
         "-V",
         help="Show version and exit",
         is_eager=True,
-        callback=lambda x: _exit_with_version(x),
+        callback=_exit_with_version,
     ),
     log_level: str = typer.Option(
         "INFO",
         "--log-level",
         "-l",
         help="Set logging level",
-        callback=lambda x: config_callback(x),
+        callback=_log_level_callback,
     ),
     config_file: str = typer.Option(
         None,
@@ -75,151 +168,20 @@ def main(
     ),
 ) -> None:
     """GlobaLLM - AI-powered open source contribution tool."""
-    load_dotenv()
-
-    # Load config if specified
-    if config_file:
-        from globallm.config.loader import load_config  # noqa: PLC0415
-
-        ctx.ensure_object(dict)
-        ctx.obj["config_path"] = Path(config_file)
-        load_config(Path(config_file))
-
-
-# Import and register commands (must come after app is defined)
-from globallm.cli import (  # noqa: E402
-    analyze,
-    assign,
-    budget,
-    config,
-    database,
-    discover,
-    fix,
-    issues,
-    prioritize,
-    redundancy,
-    repos,
-    status,
-    user,
-)
+    if os.environ.get("GLOBALLM_SKIP_DOTENV") != "1":
+        env_file = _dotenv_path()
+        if env_file:
+            from dotenv import load_dotenv  # noqa: PLC0415
 
-app.add_typer(discover.app)
-app.add_typer(analyze.app)
-app.add_typer(prioritize.app)
-app.add_typer(fix.app)
-app.add_typer(issues.app)
-app.add_typer(redundancy.app)
-app.add_typer(status.app)
-app.add_typer(user.app)
-
-app.add_typer(assign.app, rich_help_panel="Command Groups")
-app.add_typer(budget.app, rich_help_panel="Command Groups")
-app.add_typer(config.app, rich_help_panel="Command Groups")
-app.add_typer(database.app, rich_help_panel="Command Groups")
-app.add_typer(repos.app, rich_help_panel="Command Groups")
-
-
-# Legacy argparse support for backward compatibility
-def parse_args():
-    """Parse command line arguments (legacy)."""
-    import argparse
-
-    parser = argparse.ArgumentParser(
-        description="Search GitHub for impactful repositories"
-    )
-    parser.add_argument(
-        "--domain",
-        type=str,
-        default="overall",
-        help="Domain to search (default: overall)",
-    )
-    parser.add_argument("--language", type=str, help="Filter by programming language")
-    parser.add_argument(
-        "--max-results", type=int, default=20, help="Max results to return"
-    )
-    parser.add_argument(
-        "-v", "--verbose", action="store_true", help="Enable verbose logging"
-    )
-    parser.add_argument(
-        "--log-level",
-        type=str,
-        default="INFO",
-        help="Set logging level (default: INFO)",
-    )
-    parser.add_argument(
-        "--no-cache", action="store_true", help="Disable cache for this run"
-    )
-    parser.add_argument(
-        "--clear-cache", action="store_true", help="Clear the cache and exit"
-    )
-    return parser.parse_args()
-
-
-def run(args) -> None:
-    """Run the legacy scanner command."""
-    from globallm.scanner import GitHubScanner, Domain
-    from globallm.github import create_github_client
-    from globallm.logging_config import get_logger  # noqa: PLC0415
-    import os
-    import time
-
-    logger = get_logger(__name__)
-
-    if args.verbose:
-        logger.debug("Verbose mode enabled")
-
-    token = os.getenv("GITHUB_TOKEN")
-    if token:
-        logger.debug("GitHub token found in environment")
-    else:
-        logger.warning(
-            "No GITHUB_TOKEN found - using unauthenticated API (rate limited)"
-        )
-
-    github_client = create_github_client(token)
-
-    if args.clear_cache:
-        scanner = GitHubScanner(github_client)
-        scanner.clear_cache()
-        print("Cache cleared.")
-        return
-
-    use_cache = not args.no_cache
-    logger.info(
-        "initializing_scanner",
-        domain=args.domain,
-        language=args.language,
-        max_results=args.max_results,
-        use_cache=use_cache,
-    )
-
-    scanner = GitHubScanner(github_client, use_cache=use_cache)
-
-    domain = Domain(args.domain)
-
-    start_time = time.time()
-    results = scanner.search_by_domain(
-        domain, language=args.language, max_results=args.max_results
-    )
-    duration = time.time() - start_time
-
-    logger.info(
-        "search_completed",
-        result_count=len(results),
-        duration_seconds=f"{duration:.2f}",
-    )
-
-    domain_label = domain.value.replace("_", " ").title()
-    lang_label = f" ({args.language})" if args.language else ""
-    print(f"Most impactful {domain_label}{lang_label} repositories:")
-    print("-" * 60)
-    for i, repo in enumerate(results[:10], 1):
-        print(f"{i}. {repo.name}")
-        print(
-            f"   Stars: {repo.stars:,} | Forks: {repo.forks:,} | Score: {repo.score:.1f}"
-        )
-        print(f"   Language: {repo.language or 'N/A'}")
-        print()
+            load_dotenv(env_file)
+
+    ctx.obj = _CLIContext(config_path=Path(config_file) if config_file else None)
+
+    # Commands load the config lazily, from this file if one was given
+    if ctx.obj.config_path:
+        from globallm.config.loader import set_config_path  # noqa: PLC0415
+
+        set_config_path(ctx.obj.config_path)
 
 
 if __name__ == "__main__":
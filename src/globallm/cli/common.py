@@ -1,16 +1,97 @@
 """Common utilities for CLI commands."""
 
+import json
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, BinaryIO
+
 from rich import print as rprint
+from rich.console import Console
+from rich.text import Text
+
+from globallm.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Console for data-heavy output: markup still applies, but the repr
+# highlighter is not run over every line
+_console = Console(highlight=False)
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _write_jsonl(f: BinaryIO, records: Iterable[Any]) -> None:
+    """Write records to a binary file as JSON Lines.
+
+    Each record is serialized as it is written, so only one line is held
+    in memory at a time.
+    """
+    if orjson is not None:
+        f.writelines(orjson.dumps(r) + b"\n" for r in records)
+    else:
+        f.writelines((json.dumps(r) + "\n").encode() for r in records)
+
+
+# Concurrent GitHub requests per command; kept low to stay clear of
+# GitHub's secondary rate limits
+_FETCH_WORKERS = 8
+
+
+def _fetch_all[T, R](fetch: Callable[[T], R], items: Iterable[T]) -> list[R]:
+    """Run an I/O-bound fetch for each item in a thread pool.
+
+    Results are returned in input order. An exception raised by a fetch
+    propagates to the caller once the pool has drained.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fetch(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(_FETCH_WORKERS, len(items))) as executor:
+        return list(executor.map(fetch, items))
+
+
+def _dedupe_repos(repos: Iterable[str]) -> list[str]:
+    """Drop blank and repeated repository names, keeping first-seen order.
+
+    GitHub treats owner/repo case-insensitively, so names differing only
+    in case count as repeats; the first spelling is kept.
+    """
+    repos = list(repos)
+    unique: dict[str, str] = {}
+    for repo in repos:
+        name = repo.strip()
+        if name:
+            unique.setdefault(name.lower(), name)
+    if len(unique) != len(repos):
+        logger.debug("deduplicated_repos", before=len(repos), after=len(unique))
+    return list(unique.values())
 
 
 def _display_results(results: list) -> None:
     """Display repository results."""
+    if not results:
+        rprint("[yellow]No repositories matched your criteria.[/yellow]")
+        return
 
-    rprint("\n[bold]Top Results:[/bold]")
-    for i, repo in enumerate(results[:10], 1):
-        rprint(f"{i}. [bold]{repo.name}[/bold]")
-        rprint(
-            f"   Stars: {repo.stars:,} | Forks: {repo.forks:,} | Score: {repo.score:.1f}"
+    # Repo names are data, not markup: build styled text directly and
+    # render the whole listing in one print
+    text = Text.assemble("\n", ("Top Results:", "bold"))
+    for i, repo in enumerate(islice(results, 10), 1):
+        text.append(f"\n{i}. ")
+        text.append(repo.name, style="bold")
+        text.append(
+            f"\n   Stars: {repo.stars:,} | Forks: {repo.forks:,} | Score: {repo.score:.1f}"
+            f"\n   Language: {repo.language or 'N/A'}\n"
         )
-        rprint(f"   Language: {repo.language or 'N/A'}")
-        rprint()
+    _console.print(text)
@@ -1,10 +1,92 @@
 """Config subcommands."""
 
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, NoReturn
+
 import typer
 from rich import print as rprint
 
 app = typer.Typer(name="config", help="Configuration management")
 
+_TRUE_VALUES = frozenset({"true", "yes", "1"})
+_FALSE_VALUES = frozenset({"false", "no", "0"})
+
+
+def _key_not_found(key: str) -> NoReturn:
+    """Report an unknown config key and exit."""
+    rprint(f"[red]Key not found: {key}[/red]")
+    raise typer.Exit(1)
+
+
+def _parse_value(value: str) -> Any:
+    """Parse a CLI value as int, float, bool or str, in that order.
+
+    Only values containing a digit are tried as numbers, so words and
+    booleans skip the failing int()/float() conversions.
+    """
+    if any(c.isdigit() for c in value):
+        for number in (int, float):
+            try:
+                return number(value)
+            except ValueError:
+                pass
+
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    return value
+
+
+def _has_field(obj: Any, name: str) -> bool:
+    """Check whether ``name`` is a declared field of a settings model.
+
+    Unlike ``hasattr`` this never matches model methods and does not
+    swallow errors raised while computing an attribute.
+    """
+    return name in getattr(type(obj), "model_fields", ())
+
+
+@lru_cache(maxsize=64)
+def _compile_path(model: type, path: str) -> attrgetter | None:
+    """Build (once per model and path) the accessor for a dotted field path.
+
+    Returns None unless every segment is a declared field, following the
+    field annotations from ``model`` down; such paths (dict keys, model
+    methods, ``model_config``) must be walked with ``_lookup``'s checks.
+    """
+    cls = model
+    for name in path.split("."):
+        field = getattr(cls, "model_fields", {}).get(name)
+        if field is None:
+            return None
+        cls = field.annotation
+    return attrgetter(path)
+
+
+def _lookup(config: Any, path: str, key: str) -> Any:
+    """Resolve a dotted path in the config, exiting if ``key`` is unknown.
+
+    Paths made only of declared fields resolve in one compiled
+    ``attrgetter`` call; paths through dict-valued settings are walked
+    one segment at a time.
+    """
+    getter = _compile_path(type(config), path)
+    if getter is not None:
+        return getter(config)
+
+    value = config
+    for k in path.split("."):
+        if _has_field(value, k):
+            value = getattr(value, k)
+        elif isinstance(value, dict) and k in value:
+            value = value[k]
+        else:
+            _key_not_found(key)
+    return value
+
 
 @app.command()
 def show(
@@ -17,16 +99,7 @@ def show(
 
     if key:
         # Navigate nested keys with dot notation
-        keys = key.split(".")
-        value = config
-        for k in keys:
-            if hasattr(value, k):
-                value = getattr(value, k)
-            elif isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                rprint(f"[red]Key not found: {key}[/red]")
-                raise typer.Exit(1)
+        value = _lookup(config, key, key)
         rprint(f"{key}: {value}")
     else:
         rprint("[bold]Configuration file:[/bold]")
@@ -48,44 +121,18 @@ def set(
     from globallm.config.loader import load_config, save_config  # noqa: PLC0415
 
     config = load_config()
-    keys = key.split(".")
-
-    # Parse value based on type
-    try:
-        # Try int first
-        parsed_value = int(value)
-    except ValueError:
-        try:
-            # Try float
-            parsed_value = float(value)
-        except ValueError:
-            # Try bool
-            if value.lower() in ("true", "yes", "1"):
-                parsed_value = True
-            elif value.lower() in ("false", "no", "0"):
-                parsed_value = False
-            else:
-                parsed_value = value
 
-    # Set the value
-    obj = config
-    for k in keys[:-1]:
-        if hasattr(obj, k):
-            obj = getattr(obj, k)
-        elif isinstance(obj, dict) and k in obj:
-            obj = obj[k]
-        else:
-            rprint(f"[red]Key not found: {key}[/red]")
-            raise typer.Exit(1)
+    parsed_value = _parse_value(value)
 
-    final_key = keys[-1]
-    if hasattr(obj, final_key):
+    # Set the value
+    parent_path, _, final_key = key.rpartition(".")
+    obj = _lookup(config, parent_path, key) if parent_path else config
+    if _has_field(obj, final_key):
         setattr(obj, final_key, parsed_value)
     elif isinstance(obj, dict):
         obj[final_key] = parsed_value
     else:
-        rprint(f"[red]Key not found: {key}[/red]")
-        raise typer.Exit(1)
+        _key_not_found(key)
 
     save_config(config)
     rprint(f"[green]Set {key} = {parsed_value}[/green]")
@@ -3,14 +3,6 @@
 import typer
 from rich import print as rprint
 
-from globallm.storage.init_db import (
-    get_pending_migrations,
-    get_status,
-    init_database,
-    migrate as run_migrations,
-)
-from globallm.storage.db import Database
-
 app = typer.Typer(name="database", help="Database management commands")
 
 
@@ -21,6 +13,8 @@ def init(
     ),
 ) -> None:
     """Initialize the database schema."""
+    from globallm.storage.init_db import init_database  # noqa: PLC0415
+
     if drop_existing:
         rprint("[yellow]WARNING: This will delete all existing data![/yellow]")
         confirm = typer.confirm("Are you sure?")
@@ -40,6 +34,12 @@ def init(
 @app.command()
 def migrate() -> None:
     """Run pending database migrations."""
+    from globallm.storage.init_db import (  # noqa: PLC0415
+        get_pending_migrations,
+        get_status,
+        migrate as run_migrations,
+    )
+
     pending = get_pending_migrations()
 
     if not pending:
@@ -68,36 +68,42 @@ def migrate() -> None:
 @app.command()
 def status() -> None:
     """Show database status."""
+    from globallm.storage.init_db import get_status  # noqa: PLC0415
+
     try:
         status_info = get_status()
 
-        rprint("\n[bold]Database Status[/bold]")
+        lines = ["\n[bold]Database Status[/bold]"]
 
         # Schema version
         version = status_info.get("schema_version")
         if version:
-            rprint(f"  Schema version: [green]{version}[/green]")
+            lines.append(f"  Schema version: [green]{version}[/green]")
         else:
-            rprint("  Schema version: [red]Not initialized[/red]")
+            lines.append("  Schema version: [red]Not initialized[/red]")
 
         # Connection pool
         pool_info = status_info.get("pool", {})
         if pool_info.get("active"):
-            rprint("  Connection pool: [green]Active[/green]")
-            rprint(f"    Min size: {pool_info.get('min_size', 'N/A')}")
-            rprint(f"    Max size: {pool_info.get('max_size', 'N/A')}")
             stats = pool_info.get("stats", {})
-            rprint(f"    Pool stats: {stats}")
+            lines += [
+                "  Connection pool: [green]Active[/green]",
+                f"    Min size: {pool_info.get('min_size', 'N/A')}",
+                f"    Max size: {pool_info.get('max_size', 'N/A')}",
+                f"    Pool stats: {stats}",
+            ]
         else:
-            rprint("  Connection pool: [dim]Not connected[/dim]")
+            lines.append("  Connection pool: [dim]Not connected[/dim]")
 
         # Data counts
-        rprint(f"  Issues: {status_info.get('issues_count', 0)}")
-        rprint(f"  Repositories: {status_info.get('repositories_count', 0)}")
+        lines.append(f"  Issues: {status_info.get('issues_count', 0)}")
+        lines.append(f"  Repositories: {status_info.get('repositories_count', 0)}")
 
         # Error if any
         if "error" in status_info:
-            rprint(f"\n[red]Error: {status_info['error']}[/red]")
+            lines.append(f"\n[red]Error: {status_info['error']}[/red]")
+
+        rprint("\n".join(lines))
 
     except Exception as e:
         rprint(f"[red]Failed to get status: {e}[/red]")
@@ -107,6 +113,8 @@ def status() -> None:
 @app.command()
 def close() -> None:
     """Close the database connection pool."""
+    from globallm.storage.db import Database  # noqa: PLC0415
+
     rprint("[cyan]Closing database connection pool...[/cyan]")
     try:
         Database.close()
@@ -1,7 +1,7 @@
 """Discover command."""
 
 import time
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Callable
 
 import typer
@@ -24,9 +24,15 @@ def discover(
     min_dependents: int = typer.Option(None, help="Minimum dependents"),
     max_results: int = typer.Option(20, help="Max results to return"),
     use_cache: bool = typer.Option(True, help="Use cache"),
+    cache_ttl: int = typer.Option(
+        24, help="Hours to reuse cached GitHub results (0 to refresh)"
+    ),
     library_only: bool = typer.Option(
         True, help="Only include libraries (filter out apps, docs, etc.)"
     ),
+    clear_cache: bool = typer.Option(
+        False, "--clear-cache", help="Clear the GitHub result cache and exit"
+    ),
 ) -> None:
     """Discover repositories by domain and language.
 
@@ -35,11 +41,14 @@ def discover(
     from globallm.scanner import GitHubScanner, Domain
     from globallm.config.loader import load_config
     from globallm.storage.repository_store import RepositoryStore
-    from globallm.github import create_github_client
-    import os
+    from globallm.github import get_github_tokens
+
+    if clear_cache:
+        GitHubScanner.from_tokens([]).clear_cache()
+        rprint("[green]Cache cleared.[/green]")
+        return
 
     config = load_config()
-    token = os.getenv("GITHUB_TOKEN")
     store = RepositoryStore()
 
     # Apply config filters if CLI args not specified
@@ -55,7 +64,9 @@ def discover(
     rprint(f"  Min dependents: {min_dependents:,}")
     rprint(f"  Library only: {library_only}")
 
-    scanner = GitHubScanner(create_github_client(token), use_cache=use_cache)
+    scanner = GitHubScanner.from_tokens(
+        get_github_tokens(), use_cache=use_cache, cache_ttl_hours=cache_ttl
+    )
 
     try:
         domain_enum = Domain(domain)
@@ -65,7 +76,7 @@ def discover(
         rprint(f"Available domains: {', '.join(available)}")
         raise typer.Exit(1)
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     results = scanner.search_by_domain(
         domain_enum,
         language=language,
@@ -76,7 +87,7 @@ def discover(
     if library_only:
         results = scanner.filter_libraries(results)
 
-    duration = time.time() - start_time
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
 
     rprint(f"\n[green]Found {len(results)} repositories in {duration:.1f}s[/green]")
     _display_results(results)
@@ -92,10 +103,14 @@ def _save_to_store(
 
     Existing repos that have been analyzed (worth_working_on is set) are preserved.
     """
-    existing_repos = store.load_repositories()
-
-    # Convert RepoMetrics to dict and merge with existing data
-    to_save = list(existing_repos)  # Start with existing
+    if not results:
+        rprint("[dim]→ No new repositories to save[/dim]")
+        return
+
+    # Convert RepoMetrics to dict and merge with existing data; the loaded
+    # list is freshly built, so it is extended in place rather than copied
+    to_save = store.load_repositories()
+    by_name = {r.get("name"): r for r in to_save}
     new_count = 0
 
     for repo in results:
@@ -103,7 +118,7 @@ def _save_to_store(
         name = repo_dict["name"]
 
         # Check if already exists
-        existing = next((r for r in to_save if r.get("name") == name), None)
+        existing = by_name.get(name)
 
         if existing:
             # Preserve analysis fields if they exist
@@ -117,8 +132,9 @@ def _save_to_store(
             # Add new repo
             repo_dict["worth_working_on"] = None  # Not yet analyzed
             to_save.append(repo_dict)
+            by_name[name] = repo_dict
             new_count += 1
 
-    store.save_repositories(to_save, discovered_at=datetime.now())
+    store.save_repositories(to_save, discovered_at=datetime.now(UTC))
 
     rprint(f"[dim]→ Saved {len(to_save)} repositories to store ({new_count} new)[/dim]")
@@ -1,7 +1,7 @@
 """Fix command."""
 
-import os
 import re
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 import typer
@@ -12,42 +12,68 @@ if TYPE_CHECKING:
 
 app = typer.Typer(help="Analyze an issue and generate a fix")
 
+# An issue URL, or the owner/repo#123 shorthand
+_ISSUE_URL_RE = re.compile(
+    r"(?:https://github\.com/)?([^/\s]+)/([^/\s#]+)(?:/issues/|#)(\d+)"
+)
+
+# Tokens budgeted for analyzing and fixing one issue
+_ESTIMATED_FIX_TOKENS = 10_000
+
 
 @app.command()
 def fix(
     issue_url: str = typer.Option(
         None,
-        help="GitHub issue URL (optional - if not provided, works on highest priority available issue)",
+        help="GitHub issue URL or owner/repo#123 (optional - if not provided, works on highest priority available issue)",
     ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Don't actually create PR"),
     auto_merge: bool = typer.Option(True, help="Enable auto-merge if safe"),
     branch: str = typer.Option("main", help="Target branch"),
+    parallel: int = typer.Option(
+        1,
+        "--parallel",
+        min=1,
+        help="Claim and fix up to N available issues concurrently (without --issue-url)",
+    ),
 ) -> None:
     """Analyze an issue and generate a fix."""
-    from globallm.agent.heartbeat import HeartbeatManager
     from globallm.agent.identity import AgentIdentity
-    from globallm.github import create_github_client
+    from globallm.budget.budget_manager import BudgetManager
+    from globallm.github import create_github_client, get_github_token
     from globallm.storage.issue_store import IssueStore
 
-    token = os.getenv("GITHUB_TOKEN")
+    token = get_github_token()
     if not token:
-        rprint("[red]GITHUB_TOKEN required for PR creation[/red]")
+        rprint("[red]GITHUB_TOKEN or GITHUB_TOKENS required for PR creation[/red]")
         raise typer.Exit(1)
 
     github_client = create_github_client(token)
 
+    if issue_url and parallel > 1:
+        rprint("[red]--parallel only applies when no --issue-url is given[/red]")
+        raise typer.Exit(1)
+
     # Initialize components
     issue_store = IssueStore()
+
+    if not issue_url and parallel > 1:
+        _fix_available_parallel(
+            issue_store, github_client, parallel, dry_run, auto_merge, branch
+        )
+        return
+
     agent = AgentIdentity.create()
-    heartbeat_mgr = HeartbeatManager(agent.agent_id, issue_store)
 
     # Determine which issue to work on
     if issue_url:
         # Explicit URL provided - work on that specific issue
-        match = re.match(r"https://github.com/([^/]+)/([^/]+)/issues/(\d+)", issue_url)
+        match = _ISSUE_URL_RE.match(issue_url)
         if not match:
             rprint("[red]Invalid issue URL format[/red]")
-            rprint("Expected: https://github.com/owner/repo/issues/123")
+            rprint(
+                "Expected: https://github.com/owner/repo/issues/123 or owner/repo#123"
+            )
             raise typer.Exit(1)
 
         owner, repo_name, issue_number_str = match.groups()
@@ -87,12 +113,52 @@ def fix(
         rprint(f"  Title: {issue_dict.get('title', 'N/A')}")
         rprint(f"  Priority: {issue_dict.get('priority', 'N/A')}")
 
+    # Check budget; the claim goes back untouched if it doesn't fit
+    if not BudgetManager().can_process_repo(repo, _ESTIMATED_FIX_TOKENS):
+        issue_store.release_issue(repo, issue_number, agent.agent_id)
+        rprint(f"[red]Insufficient budget for {repo}[/red]")
+        raise typer.Exit(1)
+
+    _work_on_issue(
+        issue_store,
+        agent,
+        repo,
+        issue_number,
+        github_client,
+        dry_run,
+        auto_merge,
+        branch,
+    )
+
+
+def _work_on_issue(
+    issue_store,  # IssueStore
+    agent,  # AgentIdentity
+    repo: str,
+    issue_number: int,
+    github_client: Github,
+    dry_run: bool,
+    auto_merge: bool,
+    branch: str,
+    rprint: Callable[..., None] = rprint,
+) -> None:
+    """Process a claimed issue under heartbeat monitoring, then release it."""
+    from globallm.agent.heartbeat import HeartbeatManager
+
     # Start heartbeat monitoring
+    heartbeat_mgr = HeartbeatManager(agent.agent_id, issue_store)
     heartbeat_mgr.start_monitoring(repo, issue_number)
 
     try:
         _process_issue(
-            repo, issue_number, github_client, dry_run, auto_merge, branch, agent
+            repo,
+            issue_number,
+            github_client,
+            dry_run,
+            auto_merge,
+            branch,
+            agent,
+            rprint,
         )
         # Mark as completed
         issue_store.release_issue(repo, issue_number, agent.agent_id, "completed")
@@ -107,6 +173,118 @@ def fix(
         heartbeat_mgr.stop_monitoring()
 
 
+def _fix_available_parallel(
+    issue_store,  # IssueStore
+    github_client: Github,
+    parallel: int,
+    dry_run: bool,
+    auto_merge: bool,
+    branch: str,
+) -> None:
+    """Claim up to ``parallel`` available issues and fix them concurrently.
+
+    Each issue is claimed by its own agent identity, so assignments and
+    heartbeats stay one per issue. Budget is reserved for each claim
+    before anything is dispatched; claims that don't fit are released.
+    The work is LLM and GitHub API calls, so threads are enough to
+    overlap it.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from globallm.agent.identity import AgentIdentity
+    from globallm.budget.budget_manager import BudgetManager
+
+    manager = BudgetManager()
+
+    # Claim serially so each agent gets a distinct issue and the budget
+    # check sees every earlier reservation
+    claimed = []
+    over_budget = []
+    for _ in range(parallel):
+        agent = AgentIdentity.create()
+        issue_dict = issue_store.claim_next_available_issue(agent.agent_id)
+        if not issue_dict:
+            break
+        repo = issue_dict["repository"]
+        issue_number = int(issue_dict["number"])
+        if not manager.reserve(repo, _ESTIMATED_FIX_TOKENS):
+            # Released only after claiming stops, so the next claim
+            # moves on to a different issue
+            over_budget.append((agent, repo, issue_number))
+            continue
+        rprint(f"[bold cyan]Claimed issue #{issue_number} in {repo}[/bold cyan]")
+        claimed.append((agent, repo, issue_number))
+
+    for agent, repo, issue_number in over_budget:
+        issue_store.release_issue(repo, issue_number, agent.agent_id)
+        rprint(
+            f"[yellow]Insufficient budget for {repo}; "
+            f"released issue #{issue_number}[/yellow]"
+        )
+
+    if not claimed:
+        if over_budget:
+            raise typer.Exit(1)
+        rprint("[yellow]No available issues to work on[/yellow]")
+        rprint("[yellow]Run 'globallm prioritize' to populate issues[/yellow]")
+        raise typer.Exit(0)
+
+    def work(job: tuple) -> bool:
+        agent, repo, issue_number = job
+        try:
+            _work_on_issue(
+                issue_store,
+                agent,
+                repo,
+                issue_number,
+                github_client,
+                dry_run,
+                auto_merge,
+                branch,
+                _issue_printer(repo, issue_number),
+            )
+        except Exception:
+            # Already released as failed; keep the other workers going
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=len(claimed)) as executor:
+        succeeded = list(executor.map(work, claimed))
+
+    failed = succeeded.count(False)
+    rprint(
+        f"\n[bold]Processed {len(claimed)} issues:[/bold] "
+        f"{len(claimed) - failed} completed, {failed} failed"
+    )
+    if failed:
+        raise typer.Exit(1)
+
+
+def _issue_printer(repo: str, issue_number: int) -> Callable[..., None]:
+    """Build an rprint that tags each line of output with its issue.
+
+    Workers fixing issues side by side print into the same terminal; the
+    tag keeps their interleaved progress attributable.
+    """
+    from rich.console import Group
+    from rich.markup import escape
+    from rich.text import Text
+
+    tag = f"[dim]{escape(repo)}#{issue_number}[/dim] "
+
+    def tagged(*objects: object) -> None:
+        for obj in objects:
+            if isinstance(obj, str):
+                lines = [tag + line for line in obj.splitlines() if line.strip()]
+                if lines:
+                    rprint("\n".join(lines))
+            else:
+                # Renderables such as tables print whole, under a tag line
+                rprint(Group(Text.from_markup(tag), obj))
+
+    return tagged
+
+
 def _process_issue(
     repo: str,
     issue_number: int,
@@ -115,10 +293,10 @@ def _process_issue(
     auto_merge: bool,
     branch: str,
     agent,  # AgentIdentity
+    rprint: Callable[..., None] = rprint,
 ) -> None:
     """Process an issue (existing logic from original fix command)."""
     from globallm.automation.pr_automation import PRAutomation
-    from globallm.budget.budget_manager import BudgetManager
     from globallm.issues.analyzer import IssueAnalyzer
     from globallm.issues.fetcher import IssueFetcher
     from globallm.llm.claude import ClaudeLLM
@@ -127,12 +305,6 @@ def _process_issue(
 
     rprint(f"[bold cyan]Analyzing issue #{issue_number} in {repo}...[/bold cyan]")
 
-    # Check budget
-    manager = BudgetManager()
-    if not manager.can_process_repo(repo, 10000):
-        rprint(f"[red]Insufficient budget for {repo}[/red]")
-        raise typer.Exit(1)
-
     # Initialize LLM and components
     llm = ClaudeLLM()
     analyzer = IssueAnalyzer(llm)
@@ -163,10 +335,14 @@ def _process_issue(
     rprint(f"  Auto-merge: {'Yes' if solution.can_auto_merge else 'No'}")
 
     if dry_run:
+        from rich.table import Table
+
         rprint("\n[yellow]Dry run mode - skipping PR creation[/yellow]")
-        rprint("\n[bold]Proposed Changes:[/bold]")
+        table = Table(title="Proposed Changes")
+        table.add_column("File", style="cyan")
         for patch in solution.patches:
-            rprint(f"  - {patch.file_path}")
+            table.add_row(patch.file_path)
+        rprint(table)
         return
 
     # Create PR
@@ -185,8 +361,12 @@ def _process_issue(
         if pr_result.auto_merge_enabled:
             rprint("  [green]Auto-merge enabled[/green]")
         if pr_result.warnings:
-            for warning in pr_result.warnings:
-                rprint(f"  [yellow]Warning: {warning}[/yellow]")
+            rprint(
+                "\n".join(
+                    f"  [yellow]Warning: {warning}[/yellow]"
+                    for warning in pr_result.warnings
+                )
+            )
     else:
         rprint(f"\n[red]Failed to create PR: {pr_result.error}[/red]")
         raise typer.Exit(1)
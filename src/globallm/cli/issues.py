@@ -1,5 +1,8 @@
 """Issues command."""
 
+import heapq
+from operator import attrgetter
+
 import typer
 from rich import print as rprint
 
@@ -13,16 +16,19 @@ def issues(
     limit: int = typer.Option(50, help="Max issues to fetch"),
     category: str = typer.Option(None, help="Filter by category"),
     sort: str = typer.Option("priority", help="Sort by (priority, created, updated)"),
+    analyze: bool = typer.Option(
+        False, "--analyze", help="Categorize fetched issues with the LLM"
+    ),
 ) -> None:
     """Fetch and list issues from a repository."""
     from globallm.issues.fetcher import IssueFetcher
     from globallm.issues.analyzer import IssueAnalyzer
     from globallm.budget.budget_manager import BudgetManager
     from globallm.models.issue import IssueCategory
-    from globallm.github import create_github_client
+    from globallm.github import create_github_client, get_github_token
     import os
 
-    token = os.getenv("GITHUB_TOKEN")
+    token = get_github_token()
 
     rprint(f"[bold cyan]Fetching issues from {repo}...[/bold cyan]")
 
@@ -37,31 +43,37 @@ def issues(
     fetcher = IssueFetcher(github_client)
     issues = fetcher.fetch_repo_issues(repo, state=state, limit=limit)
 
-    # Analyze issues if we have an LLM configured
-    if os.getenv("ANTHROPIC_API_KEY") or os.getenv("OPENAI_API_KEY"):
+    # Analyze issues if asked to and we have an LLM configured
+    if analyze and (os.getenv("ANTHROPIC_API_KEY") or os.getenv("OPENAI_API_KEY")):
         from globallm.llm.claude import ClaudeLLM
 
         llm = ClaudeLLM()
         analyzer = IssueAnalyzer(llm)
         rprint("\n[yellow]Analyzing issues with LLM...[/yellow]")
-        for issue in issues:
-            analyzed = analyzer.categorize_issue(issue)
+        for issue, analyzed in zip(issues, analyzer.categorize_issues_batched(issues)):
             issue.category = analyzed.category
             issue.complexity = analyzed.complexity
-
-    # Sort issues
-    if sort == "priority":
-        issues.sort(key=lambda i: i.priority_score, reverse=True)
-    elif sort == "created":
-        issues.sort(key=lambda i: i.created_at, reverse=True)
-    elif sort == "updated":
-        issues.sort(key=lambda i: i.updated_at, reverse=True)
+    elif analyze:
+        rprint(
+            "[yellow]Skipping analysis: set ANTHROPIC_API_KEY or OPENAI_API_KEY[/yellow]"
+        )
 
     # Filter by category if specified
     if category:
         cat_enum = IssueCategory.from_string(category)
         issues = [i for i in issues if i.category == cat_enum]
 
+    # Only the first 20 are shown, so select them rather than sorting everything
+    sort_keys = {
+        "priority": "priority_score",
+        "created": "created_at",
+        "updated": "updated_at",
+    }
+    if sort in sort_keys:
+        shown = heapq.nlargest(20, issues, key=attrgetter(sort_keys[sort]))
+    else:
+        shown = issues[:20]
+
     # Display results
     rprint(f"\n[green]Found {len(issues)} issues[/green]")
 
@@ -78,14 +90,14 @@ def issues(
         table.add_column("Priority", style="green", justify="right")
         table.add_column("Created", style="dim")
 
-        for issue in issues[:20]:
+        for issue in shown:
             table.add_row(
                 str(issue.number),
                 issue.title[:50] + "..." if len(issue.title) > 50 else issue.title,
                 issue.category.value,
                 issue.severity.value,
                 f"{issue.priority_score:.1f}",
-                issue.created_at.strftime("%Y-%m-%d"),
+                issue.created_at.date().isoformat(),
             )
 
         console.print(table)
@@ -1,15 +1,15 @@
 """Prioritize command."""
 
-import json
-from typing import TYPE_CHECKING, cast
+import heapq
+from operator import attrgetter
+from typing import cast
 
 import typer
 from rich import print as rprint
 from rich.table import Table
 from rich.console import Console
 
-if TYPE_CHECKING:
-    from globallm.storage.repository_store import RepositoryStore
+from globallm.cli.common import _dedupe_repos, _dump_json, _fetch_all, _write_jsonl
 
 app = typer.Typer(help="Prioritize issues across repositories")
 
@@ -19,7 +19,7 @@ def prioritize(
     language: str = typer.Option(None, help="Filter by programming language"),
     top: int = typer.Option(20, help="Number of top issues to show"),
     min_priority: float = typer.Option(0.0, help="Minimum priority score"),
-    export: str = typer.Option(None, help="Export to file (json, csv)"),
+    export: str = typer.Option(None, help="Export to file (json, jsonl)"),
 ) -> None:
     """Prioritize issues across approved repositories.
 
@@ -34,10 +34,9 @@ def prioritize(
     from globallm.config.loader import load_config
     from globallm.storage.repository_store import RepositoryStore
     from globallm.storage.issue_store import IssueStore
-    from globallm.github import create_github_client
-    import os
+    from globallm.github import create_github_client, get_github_token
 
-    token = os.getenv("GITHUB_TOKEN")
+    token = get_github_token()
     github_client = create_github_client(token)
     config = load_config()
     store = RepositoryStore()
@@ -56,19 +55,14 @@ def prioritize(
         rprint("  3. globallm analyze psf/requests")
         raise typer.Exit(1)
 
-    # Extract repo names
+    # Extract repo names, filtering by language on the loaded records
     repos = [
         cast(str, r.get("name"))
         for r in approved_repos
         if isinstance(r.get("name"), str)
+        and (not language or r.get("language") == language)
     ]
-
-    if language:
-        # Filter by language
-        repos = [r for r in repos if _get_repo_language(store, r) == language]
-
-    # Filter out None values (should be redundant but type-safe)
-    repos = [r for r in repos if r is not None]
+    repos = _dedupe_repos(repos)
 
     if not repos:
         rprint("[yellow]No repositories matching criteria[/yellow]")
@@ -86,16 +80,22 @@ def prioritize(
     prioritizer = IssuePrioritizer(analyzer)
     manager = BudgetManager()
 
-    # Fetch and prioritize issues per repository
-    all_issues = []
+    # Budget checks run up front; only the GitHub fetches run concurrently
+    fetch_repos = manager.filter_processable(repos)
+    allowed = set(fetch_repos)
     for repo in repos:
-        if not manager.can_process_repo(repo):
+        if repo not in allowed:
             rprint(f"[yellow]Skipping {repo} - budget limit[/yellow]")
-            continue
 
-        fetcher = IssueFetcher(github_client)
-        issues = fetcher.fetch_repo_issues(repo, state="open", limit=50)
+    fetcher = IssueFetcher(github_client)
+    fetched = _fetch_all(
+        lambda repo: fetcher.fetch_repo_issues(repo, state="open", limit=50),
+        fetch_repos,
+    )
 
+    # Prioritize and store issues per repository
+    all_issues = []
+    for repo, issues in zip(fetch_repos, fetched):
         rprint(f"[dim]Processing {len(issues)} issues from {repo}...[/dim]")
         for issue in issues:
             priority = prioritizer.calculate_priority(issue)
@@ -119,22 +119,18 @@ def prioritize(
 
     rprint(f"[green]Processed and saved {len(all_issues)} issues[/green]")
 
-    # Filter and sort
+    # Filter and keep only the top issues; no need to sort the rest
     filtered_issues = [i for i in all_issues if i.priority_score >= min_priority]
-    filtered_issues.sort(key=lambda i: i.priority_score, reverse=True)
+    top_issues = heapq.nlargest(top, filtered_issues, key=attrgetter("priority_score"))
 
     # Display results
-    _display_results(filtered_issues, top, min_priority)
+    _display_results(top_issues, top, min_priority)
 
     # Export if requested
     if export == "json":
-        _export_json(filtered_issues[:top])
-
-
-def _get_repo_language(store: RepositoryStore, repo_name: str) -> str | None:
-    """Get language for a repository from store."""
-    repo = store.get_repository(repo_name)
-    return repo.get("language") if repo else None
+        _export_json(top_issues)
+    elif export == "jsonl":
+        _export_jsonl(top_issues)
 
 
 def _display_results(issues: list, top: int, min_priority: float) -> None:
@@ -164,18 +160,27 @@ def _display_results(issues: list, top: int, min_priority: float) -> None:
     console.print(table)
 
 
+def _issue_record(issue) -> dict:
+    """Exported fields of a prioritized issue."""
+    return {
+        "repository": issue.repository,
+        "number": issue.number,
+        "title": issue.title,
+        "priority": issue.priority_score,
+        "category": issue.category.value,
+    }
+
+
 def _export_json(issues: list) -> None:
     """Export issues to JSON file."""
-    data = [
-        {
-            "repository": i.repository,
-            "number": i.number,
-            "title": i.title,
-            "priority": i.priority_score,
-            "category": i.category.value,
-        }
-        for i in issues
-    ]
-    with open("prioritized_issues.json", "w") as f:
-        json.dump(data, f, indent=2)
+    data = [_issue_record(i) for i in issues]
+    with open("prioritized_issues.json", "wb") as f:
+        f.write(_dump_json(data))
     rprint("\n[green]Exported to prioritized_issues.json[/green]")
+
+
+def _export_jsonl(issues: list) -> None:
+    """Export issues to a JSON Lines file, one issue per line."""
+    with open("prioritized_issues.jsonl", "wb") as f:
+        _write_jsonl(f, (_issue_record(i) for i in issues))
+    rprint("\n[green]Exported to prioritized_issues.jsonl[/green]")
@@ -1,41 +1,49 @@
 """Redundancy command."""
 
+from operator import itemgetter
+
 import typer
 from rich import print as rprint
 
 app = typer.Typer(help="Detect redundancy between repositories")
 
+# The opening of a README carries the similarity signal; cap what we keep
+_MAX_README_BYTES = 256 * 1024
+
 
 @app.command()
 def redundancy(
     repos: list[str] = typer.Argument(..., help="Repositories to compare (owner/repo)"),
     threshold: float = typer.Option(0.75, help="Similarity threshold (0-1)"),
+    cache_ttl: int = typer.Option(
+        24, help="Hours to reuse cached GitHub results (0 to refresh)"
+    ),
 ) -> None:
     """Detect redundancy between repositories."""
     from globallm.scanner import GitHubScanner
     from globallm.analysis.redundancy import RedundancyDetector
     from globallm.models.repository import Language
-    from globallm.github import create_github_client
-    import os
+    from globallm.github import get_github_tokens
+    from globallm.cli.common import _console, _dedupe_repos, _fetch_all
 
-    token = os.getenv("GITHUB_TOKEN")
-    scanner = GitHubScanner(create_github_client(token))
+    scanner = GitHubScanner.from_tokens(get_github_tokens(), cache_ttl_hours=cache_ttl)
     detector = RedundancyDetector()
+    repos = _dedupe_repos(repos)
 
     rprint("[bold cyan]Analyzing repository redundancy...[/bold cyan]")
 
-    # Fetch repo data and READMEs
-    repo_data = []
-    for repo_name in repos:
+    def fetch_one(repo_name: str) -> dict | Exception:
         try:
             metrics = scanner.analyze_repo(repo_name)
 
             # Try to get README
             readme = ""
             try:
-                repo = scanner.github.get_repo(repo_name)
-                readme_content = repo.get_readme()
-                readme = readme_content.decoded_content.decode()
+                readme_content = scanner.get_readme(repo_name)
+                # Truncation may split a multi-byte character; drop it
+                readme = readme_content.decoded_content[:_MAX_README_BYTES].decode(
+                    errors="ignore"
+                )
             except Exception:
                 pass
 
@@ -44,53 +52,48 @@ def redundancy(
             if metrics.language:
                 language = Language.from_string(metrics.language)
 
-            repo_data.append(
-                {
-                    "name": repo_name,
-                    "stars": metrics.stars,
-                    "readme": readme,
-                    "language": language,
-                    "api_signature": None,  # Would need file analysis
-                }
-            )
+            return {
+                "name": repo_name,
+                "stars": metrics.stars,
+                "readme": readme,
+                "language": language,
+                "api_signature": None,  # Would need file analysis
+            }
         except Exception as e:
-            rprint(f"[yellow]Warning: Could not analyze {repo_name}: {e}[/yellow]")
+            return e
+
+    # Fetch repo data and READMEs
+    repo_data = []
+    for repo_name, result in zip(repos, _fetch_all(fetch_one, repos)):
+        if isinstance(result, Exception):
+            rprint(f"[yellow]Warning: Could not analyze {repo_name}: {result}[/yellow]")
+        else:
+            repo_data.append(result)
 
     # Compare all pairs
     rprint("\n[bold]Redundancy Analysis:[/bold]\n")
-    found_redundancy = False
-
-    for i in range(len(repo_data)):
-        for j in range(i + 1, len(repo_data)):
-            repo_a = repo_data[i]
-            repo_b = repo_data[j]
-
-            readme_sim = detector.compute_readme_similarity(
-                repo_a["readme"], repo_b["readme"]
-            )
-
-            if readme_sim > threshold:
-                found_redundancy = True
-                keep = (
-                    repo_a["name"]
-                    if repo_a["stars"] >= repo_b["stars"]
-                    else repo_b["name"]
-                )
-                archive = (
-                    repo_b["name"]
-                    if repo_a["stars"] >= repo_b["stars"]
-                    else repo_a["name"]
-                )
-
-                rprint("[red]Redundancy detected:[/red]")
-                rprint(f"  {repo_a['name']} <-> {repo_b['name']}")
-                rprint(f"  README similarity: {readme_sim:.1%}")
-                rprint(
-                    f"  Recommendation: Keep [green]{keep}[/green], archive {archive}"
-                )
-                rprint()
 
-    if not found_redundancy:
-        rprint("[green]No significant redundancy found[/green]")
-        for repo in repo_data:
-            rprint(f"  - {repo['name']}: {repo['stars']:,} stars")
+    readmes = [repo["readme"] for repo in repo_data]
+    candidates = detector.candidate_pairs(readmes, threshold)
+    similarities = detector.readme_pair_similarities(readmes, candidates)
+    fields = itemgetter("name", "stars")
+    lines: list[str] = []
+    for (i, j), readme_sim in zip(candidates, similarities):
+        if readme_sim > threshold:
+            name_a, stars_a = fields(repo_data[i])
+            name_b, stars_b = fields(repo_data[j])
+            keep, archive = (name_a, name_b) if stars_a >= stars_b else (name_b, name_a)
+            lines += [
+                "[red]Redundancy detected:[/red]",
+                f"  {name_a} <-> {name_b}",
+                f"  README similarity: {readme_sim:.1%}",
+                f"  Recommendation: Keep [green]{keep}[/green], archive {archive}",
+                "",
+            ]
+
+    if not lines:
+        lines.append("[green]No significant redundancy found[/green]")
+        lines += [f"  - {repo['name']}: {repo['stars']:,} stars" for repo in repo_data]
+
+    # One print for the whole report rather than one per line
+    _console.print("\n".join(lines))
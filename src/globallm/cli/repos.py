@@ -1,14 +1,9 @@
 """Repos command for managing stored repositories."""
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable
+from typing import Any, Callable
 
 import typer
 from rich import print as rprint
-from rich.table import Table
-
-if TYPE_CHECKING:
-    pass
 
 app = typer.Typer(name="repos", help="Manage stored repositories")
 
@@ -28,36 +23,31 @@ def list(
 
     store = RepositoryStore()
 
-    # Get repositories based on filter
     if filter == "approved":
-        repos = store.get_approved()
         title = "Approved Repositories (worth_working_on=true)"
     elif filter == "rejected":
-        repos = store.get_rejected()
         title = "Rejected Repositories (worth_working_on=false)"
     elif filter == "unanalyzed":
-        repos = store.get_unanalyzed()
         title = "Unanalyzed Repositories"
     else:
-        repos = store.load_repositories()
+        filter = "all"
         title = "All Stored Repositories"
 
+    # The database sorts by stars (descending) and applies the limit
+    repos = store.get_top_repositories(filter, limit)
+
     if not repos:
         rprint("[yellow]No repositories found[/yellow]")
         return
 
-    # Sort by stars (descending)
-    repos.sort(key=lambda r: r.get("stars", 0), reverse=True)
-
-    # Apply limit
-    repos = repos[:limit]
-
     # Display table
     _display_table(repos, title, rprint)
 
 
 def _display_table(repos: list[dict[str, Any]], title: str, rprint: Callable) -> None:
     """Display repositories in a table."""
+    from rich.table import Table  # noqa: PLC0415
+
     table = Table(title=title)
     table.add_column("Repository", style="cyan")
     table.add_column("Stars", style="yellow", justify="right")
@@ -152,6 +142,8 @@ def show(
 
     analyzed_at = repo_data.get("analyzed_at")
     if analyzed_at:
+        from datetime import datetime  # noqa: PLC0415
+
         try:
             dt = datetime.fromisoformat(analyzed_at)
             rprint(f"  Analyzed: {dt.strftime('%Y-%m-%d %H:%M')}")
@@ -168,12 +160,9 @@ def remove(
 
     store = RepositoryStore()
 
-    if not store.get_repository(repo):
-        rprint(f"[red]Repository '{repo}' not found in store[/red]")
-        raise typer.Exit(1)
-
+    # A single DELETE; no row removed means the repository wasn't stored
     if not store.delete_repository(repo):
-        rprint(f"[red]Failed to remove '{repo}' from store[/red]")
+        rprint(f"[red]Repository '{repo}' not found in store[/red]")
         raise typer.Exit(1)
 
     rprint(f"[green]Removed '{repo}' from store[/green]")
@@ -1,10 +1,22 @@
 """Status command."""
 
+import functools
+import sys
+
 import typer
 from rich import print as rprint
 
+from globallm.cli.common import _console
+
 app = typer.Typer(help="Show system status and statistics")
 
+# Placeholder breakdown until per-language PR tracking is wired in
+_LANGUAGE_BREAKDOWN = (
+    "\n[bold]Language Breakdown:[/bold]\n"
+    "  Python:      [blue]" + "░" * 21 + "[/blue] 0 PRs\n"
+    "  JavaScript:  [blue]" + "░" * 21 + "[/blue] 0 PRs"
+)
+
 
 @app.command()
 def status(
@@ -16,32 +28,92 @@ def status(
 
     config = load_config()
 
+    if export is not None:
+        _export_status(config, export)
+        return
+
     if dashboard:
         _show_dashboard(config)
         return
 
-    rprint("[bold cyan]GlobaLLM Status[/bold cyan]")
-    rprint(f"  Log level: {config.log_level}")
-    rprint(f"  LLM provider: {config.llm_provider}")
-    rprint(f"  LLM model: {config.llm_model}")
+    _console.print(
+        _render_status(
+            config.log_level,
+            config.llm_provider,
+            config.llm_model,
+            config.filters.min_stars,
+            config.filters.min_dependents,
+            config.filters.min_health_score,
+            config.budget.weekly_token_budget,
+            config.budget.max_tokens_per_repo,
+        )
+    )
 
-    rprint("\n[bold]Filters[/bold]")
-    rprint(f"  Min stars: {config.filters.min_stars:,}")
-    rprint(f"  Min dependents: {config.filters.min_dependents:,}")
-    rprint(f"  Min health score: {config.filters.min_health_score}")
 
-    rprint("\n[bold]Budget[/bold]")
-    rprint(f"  Weekly token budget: {config.budget.weekly_token_budget:,}")
-    rprint(f"  Max tokens per repo: {config.budget.max_tokens_per_repo:,}")
+def _export_status(config, export: str) -> None:
+    """Write the status summary to stdout in the given format."""
+    from globallm.cli.common import _dump_json  # noqa: PLC0415
+
+    if export != "json":
+        rprint(f"[red]Unsupported export format: {export}[/red]")
+        raise typer.Exit(1)
+
+    data = {
+        "log_level": config.log_level,
+        "llm_provider": config.llm_provider,
+        "llm_model": config.llm_model,
+        "filters": {
+            "min_stars": config.filters.min_stars,
+            "min_dependents": config.filters.min_dependents,
+            "min_health_score": config.filters.min_health_score,
+        },
+        "budget": {
+            "weekly_token_budget": config.budget.weekly_token_budget,
+            "max_tokens_per_repo": config.budget.max_tokens_per_repo,
+        },
+    }
+    sys.stdout.buffer.write(_dump_json(data) + b"\n")
+    sys.stdout.flush()
+
+
+@functools.cache
+def _render_status(
+    log_level: str,
+    llm_provider: str,
+    llm_model: str,
+    min_stars: int,
+    min_dependents: int,
+    min_health_score: float,
+    weekly_token_budget: int,
+    max_tokens_per_repo: int,
+) -> str:
+    """Render the status summary.
+
+    Keyed on the displayed values, so a changed config renders afresh.
+    """
+    return "\n".join(
+        [
+            "[bold cyan]GlobaLLM Status[/bold cyan]",
+            f"  Log level: {log_level}",
+            f"  LLM provider: {llm_provider}",
+            f"  LLM model: {llm_model}",
+            "\n[bold]Filters[/bold]",
+            f"  Min stars: {min_stars:,}",
+            f"  Min dependents: {min_dependents:,}",
+            f"  Min health score: {min_health_score}",
+            "\n[bold]Budget[/bold]",
+            f"  Weekly token budget: {weekly_token_budget:,}",
+            f"  Max tokens per repo: {max_tokens_per_repo:,}",
+        ]
+    )
 
 
 def _show_dashboard(config) -> None:
     """Show the status dashboard."""
-    from rich.console import Console
+    from rich.console import Group
     from rich.table import Table
     from rich.panel import Panel
-
-    console = Console()
+    from rich.text import Text
 
     # Header panel
     header = Panel(
@@ -49,7 +121,6 @@ def _show_dashboard(config) -> None:
         f"Budget: 0 / {config.budget.weekly_token_budget:,} tokens (0%)",
         title="Status",
     )
-    console.print(header)
 
     # Repository table
     table = Table(title="Active Repositories")
@@ -62,9 +133,5 @@ def _show_dashboard(config) -> None:
     # Add placeholder row
     table.add_row("No active repositories", "0", "0", "0", "0.0")
 
-    console.print(table)
-
-    # Language breakdown
-    rprint("\n[bold]Language Breakdown:[/bold]")
-    rprint("  Python:      [blue]░░░░░░░░░░░░░░░░░░░░░[/blue] 0 PRs")
-    rprint("  JavaScript:  [blue]░░░░░░░░░░░░░░░░░░░░░[/blue] 0 PRs")
+    # Render everything, including the language breakdown, in one pass
+    _console.print(Group(header, table, Text.from_markup(_LANGUAGE_BREAKDOWN)))
@@ -1,6 +1,7 @@
 """User repository analysis command."""
 
 import time
+from collections import Counter
 from typing import TYPE_CHECKING
 
 import typer
@@ -12,6 +13,12 @@ if TYPE_CHECKING:
 
 app = typer.Typer(help="Analyze user repositories")
 
+_RECOMMENDATION_STYLES = {
+    "Keep": "green",
+    "Archive": "red",
+    "Evaluate": "yellow",
+}
+
 
 @app.command()
 def analyze_user(
@@ -23,25 +30,22 @@ def analyze_user(
 ) -> None:
     """Analyze all repositories owned by a user."""
     from globallm.scanner import GitHubScanner
-    from globallm.github import create_github_client
-    import os
-
-    token = os.getenv("GITHUB_TOKEN")
+    from globallm.github import get_github_tokens
 
     rprint(f"[bold cyan]Analyzing repositories for {username}...[/bold cyan]")
     rprint(f"  Min stars: {min_stars:,}")
     rprint(f"  Include forks: {include_forks}")
 
-    scanner = GitHubScanner(create_github_client(token))
+    scanner = GitHubScanner.from_tokens(get_github_tokens())
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     results = scanner.analyze_user_repos(
         username=username,
         min_stars=min_stars,
         include_forks=include_forks,
         max_results=max_results,
     )
-    duration = time.time() - start_time
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
 
     rprint(f"\n[green]Found {len(results)} repositories in {duration:.1f}s[/green]")
 
@@ -61,9 +65,9 @@ def analyze_user(
     if recommend:
         table.add_column("Recommendation")
 
-    for i, repo in enumerate(results, 1):
-        recommendation = _get_recommendation(repo)
-        rec_style = _get_recommendation_style(recommendation)
+    recommendations = [_get_recommendation(repo) for repo in results]
+    for i, (repo, recommendation) in enumerate(zip(results, recommendations), 1):
+        rec_style = _RECOMMENDATION_STYLES.get(recommendation, "white")
 
         table.add_row(
             str(i),
@@ -79,7 +83,7 @@ def analyze_user(
     rprint(table)
 
     if recommend:
-        _print_summary(results, username)
+        _print_summary(recommendations, username)
 
 
 def _get_recommendation(repo: RepoMetrics) -> str:
@@ -96,21 +100,12 @@ def _get_recommendation(repo: RepoMetrics) -> str:
     return "Archive"
 
 
-def _get_recommendation_style(recommendation: str) -> str:
-    """Get style for recommendation."""
-    styles = {
-        "Keep": "green",
-        "Archive": "red",
-        "Evaluate": "yellow",
-    }
-    return styles.get(recommendation, "white")
-
-
-def _print_summary(results: list, username: str) -> None:
+def _print_summary(recommendations: list[str], username: str) -> None:
     """Print summary of recommendations."""
-    keep = sum(1 for r in results if _get_recommendation(r) == "Keep")
-    evaluate = sum(1 for r in results if _get_recommendation(r) == "Evaluate")
-    archive = sum(1 for r in results if _get_recommendation(r) == "Archive")
+    counts = Counter(recommendations)
+    keep = counts["Keep"]
+    evaluate = counts["Evaluate"]
+    archive = counts["Archive"]
 
     rprint(f"\n[bold]Summary for {username}:[/bold]")
     rprint(f"  [green]Keep: {keep}[/green] (high impact)")
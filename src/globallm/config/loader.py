@@ -4,11 +4,10 @@ import signal
 from pathlib import Path
 from typing import Any, Callable
 
-import yaml
 from pydantic import ValidationError
 
 from globallm.config.settings import Settings
-from globallm.config.defaults import DEFAULT_CONFIG_DICT
+from globallm.config.defaults import DEFAULT_CONFIG, DEFAULT_CONFIG_DICT
 from globallm.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -17,6 +16,8 @@ logger = get_logger(__name__)
 _global_settings: Settings | None = None
 _config_path: Path | None = None
 _reload_callbacks: list[Callable[[Settings | None, Settings | None], None]] = []
+# Parsed settings per resolved path, tagged with the file mtime they were read at
+_config_cache: dict[Path, tuple[int, Settings]] = {}
 
 
 def get_config_path() -> Path:
@@ -27,56 +28,93 @@ def get_config_path() -> Path:
 
 
 def _merge_dicts(base: dict, override: dict) -> dict:
-    """Recursively merge override dict into base dict."""
+    """Recursively merge override dict into base dict.
+
+    Only the dicts on an overridden path are copied; base is never
+    modified.
+    """
     result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                dst[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                dst[key] = value
     return result
 
 
 def _settings_from_dict(data: dict[str, Any] | None) -> Settings:
     """Create Settings from dict with defaults."""
     if data is None:
-        return Settings(**DEFAULT_CONFIG_DICT)
+        return DEFAULT_CONFIG.model_copy(deep=True)
 
     merged = _merge_dicts(DEFAULT_CONFIG_DICT, data)
-    return Settings(**merged)
+    return Settings.model_validate(merged)
+
+
+def set_config_path(path: Path | str) -> None:
+    """Set the config file used when no path is passed.
+
+    Nothing is read until the configuration is first loaded.
+
+    Args:
+        path: Path to config file.
+    """
+    global _config_path
+    _config_path = Path(path)
 
 
 def load_config(path: Path | str | None = None) -> Settings:
     """Load configuration from YAML file.
 
+    Parsed settings are cached per path and reused until the file's
+    modification time changes.
+
     Args:
-        path: Path to config file. If None, uses default path.
+        path: Path to config file. If None, uses the path from the last
+            load (or set_config_path), else the default path.
 
     Returns:
         Settings object with loaded configuration.
     """
     global _global_settings, _config_path
 
+    import yaml  # noqa: PLC0415
+
     if path is None:
-        path = get_config_path()
+        path = _config_path or get_config_path()
     else:
         path = Path(path)
 
     _config_path = path
 
-    if not path.exists():
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
         logger.info("config_not_found", path=str(path), using_defaults=True)
-        _global_settings = Settings(**DEFAULT_CONFIG_DICT)
+        _global_settings = DEFAULT_CONFIG.model_copy(deep=True)
         _save_default_config(path)
         return _global_settings
 
+    key = path.resolve()
+    cached = _config_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        _global_settings = cached[1]
+        return _global_settings
+
     try:
         with path.open() as f:
-            data = yaml.safe_load(f)
+            # libyaml's C loader when PyYAML was built with it
+            data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
             if data is None:
                 data = {}
 
         _global_settings = _settings_from_dict(data)
+        _config_cache[key] = (mtime, _global_settings)
         logger.info("config_loaded", path=str(path))
         return _global_settings
 
@@ -93,9 +131,17 @@ def load_config(path: Path | str | None = None) -> Settings:
 
 def _save_default_config(path: Path) -> None:
     """Save default configuration to file."""
+    import yaml  # noqa: PLC0415
+
     try:
         with path.open("w") as f:
-            yaml.dump(DEFAULT_CONFIG_DICT, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                DEFAULT_CONFIG_DICT,
+                f,
+                Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                default_flow_style=False,
+                sort_keys=False,
+            )
         logger.info("default_config_saved", path=str(path))
     except Exception as e:
         logger.warning("default_config_save_failed", path=str(path), error=str(e))
@@ -110,18 +156,22 @@ def save_config(settings: Settings, path: Path | str | None = None) -> None:
     """
     global _config_path
 
+    import yaml  # noqa: PLC0415
+
     if path is None:
         path = _config_path or get_config_path()
     else:
         path = Path(path)
 
     _config_path = path
+    _config_cache.pop(path.resolve(), None)
 
     try:
         with path.open("w") as f:
             yaml.dump(
                 settings.model_dump(mode="json", exclude_none=True),
                 f,
+                Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
                 default_flow_style=False,
                 sort_keys=False,
             )
@@ -139,6 +189,7 @@ def reload_config() -> Settings:
         _config_path = get_config_path()
 
     old_settings = _global_settings
+    _config_cache.clear()
     _global_settings = load_config(_config_path)
 
     # Notify callbacks
@@ -1,5 +1,11 @@
 """GitHub client utilities."""
 
+import itertools
+import os
+import threading
+import time
+from collections.abc import Sequence
+
 from github import Github
 
 from globallm.logging_config import get_logger
@@ -7,6 +13,32 @@ from globallm.logging_config import get_logger
 logger = get_logger(__name__)
 
 _DEFAULT_PER_PAGE = 100
+# Keep-alive connections each client's session keeps open. Must cover the
+# CLI's concurrent fetch workers, or connections beyond the pool size are
+# discarded after each request and every reuse pays a new TLS handshake.
+_DEFAULT_POOL_SIZE = 16
+
+
+def get_github_tokens() -> list[str]:
+    """Read GitHub tokens from the environment.
+
+    GITHUB_TOKENS holds a comma-separated pool of tokens; GITHUB_TOKEN is
+    used when it is not set.
+
+    Returns:
+        List of tokens, empty when none are configured
+    """
+    tokens = os.getenv("GITHUB_TOKENS")
+    if tokens:
+        return [token.strip() for token in tokens.split(",") if token.strip()]
+    token = os.getenv("GITHUB_TOKEN")
+    return [token] if token else []
+
+
+def get_github_token() -> str | None:
+    """Return the first configured GitHub token, if any."""
+    tokens = get_github_tokens()
+    return tokens[0] if tokens else None
 
 
 def create_github_client(token: str | None = None, **kwargs) -> Github:
@@ -17,9 +49,14 @@ def create_github_client(token: str | None = None, **kwargs) -> Github:
         **kwargs: Additional settings to pass to Github()
 
     Returns:
-        Github client instance with per_page=100 by default
+        Github client instance with per_page=100 and a connection pool
+        sized for concurrent fetches by default
     """
-    settings = {"per_page": _DEFAULT_PER_PAGE, **kwargs}
+    settings = {
+        "per_page": _DEFAULT_PER_PAGE,
+        "pool_size": _DEFAULT_POOL_SIZE,
+        **kwargs,
+    }
     client = Github(token, **settings) if token else Github(**settings)
 
     if token:
@@ -28,3 +65,52 @@ def create_github_client(token: str | None = None, **kwargs) -> Github:
         logger.debug("github_client_created", authenticated=False)
 
     return client
+
+
+def _is_cooling_down(client: Github, now: float) -> bool:
+    """Check whether a client's last response exhausted its rate limit."""
+    # Read the requester directly: Github.rate_limiting issues a request
+    # when no response has been seen yet
+    remaining, _ = client.requester.rate_limiting
+    return remaining == 0 and client.requester.rate_limiting_resettime > now
+
+
+class GitHubClientPool:
+    """Round-robin pool of GitHub clients, one per token.
+
+    Each token has its own rate limit, so spreading requests across the
+    pool multiplies the effective budget. Clients whose rate limit is
+    exhausted are skipped until their reset time.
+    """
+
+    def __init__(self, tokens: Sequence[str], **kwargs) -> None:
+        """Initialize the pool.
+
+        Args:
+            tokens: GitHub API tokens, at least one
+            **kwargs: Additional settings to pass to each client
+        """
+        if not tokens:
+            raise ValueError("GitHubClientPool needs at least one token")
+        self.clients = [create_github_client(token, **kwargs) for token in tokens]
+        self._cycle = itertools.cycle(self.clients)
+        self._lock = threading.Lock()
+        logger.debug("github_client_pool_created", size=len(self.clients))
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def next_client(self) -> Github:
+        """Return the next client that is not cooling down.
+
+        When every token is exhausted, the client whose limit resets
+        first is returned.
+        """
+        now = time.time()
+        with self._lock:
+            for _ in range(len(self.clients)):
+                client = next(self._cycle)
+                if not _is_cooling_down(client, now):
+                    return client
+        logger.warning("github_token_pool_exhausted", size=len(self.clients))
+        return min(self.clients, key=lambda c: c.requester.rate_limiting_resettime)
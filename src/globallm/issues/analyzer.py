@@ -1,10 +1,18 @@
 """LLM-based issue analysis and categorization."""
 
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
 from typing import Any
 
 from globallm.llm.base import BaseLLM
-from globallm.llm.prompts import format_issue_categorization_prompt
+from globallm.llm.prompts import (
+    format_issue_batch_categorization_prompt,
+    format_issue_categorization_prompt,
+)
 from globallm.logging_config import get_logger
 from globallm.models.issue import (
     Issue,
@@ -41,13 +49,28 @@ class IssueAnalysis:
 class IssueAnalyzer:
     """Analyze issues using LLMs."""
 
-    def __init__(self, llm: BaseLLM) -> None:
+    CACHE_DIR = Path.home() / ".cache" / "globallm" / "llm"
+    DEFAULT_CACHE_TTL_HOURS = 7 * 24
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        cache_dir: Path | None = None,
+        use_cache: bool = True,
+        cache_ttl_hours: int = DEFAULT_CACHE_TTL_HOURS,
+    ) -> None:
         """Initialize with an LLM instance.
 
         Args:
             llm: LLM instance for analysis
+            cache_dir: Directory for cached LLM responses
+            use_cache: Whether to reuse responses for unchanged prompts
+            cache_ttl_hours: How long cached responses stay valid
         """
         self.llm = llm
+        self.cache_dir = cache_dir or self.CACHE_DIR
+        self.use_cache = use_cache
+        self.cache_ttl_hours = cache_ttl_hours
 
     def categorize_issue(self, issue: Issue) -> IssueAnalysis:
         """Categorize an issue using LLM.
@@ -60,7 +83,58 @@ class IssueAnalyzer:
         """
         logger.info("categorizing_issue", repo=issue.repository, number=issue.number)
 
-        prompt = format_issue_categorization_prompt(
+        prompt = self._issue_prompt(issue)
+
+        try:
+            response = self._complete_json_cached(prompt)
+            return self._parse_analysis(issue, response, response.get("tokens_used", 0))
+
+        except Exception as e:
+            logger.warning(
+                "llm_categorization_failed", issue=issue.number, error=str(e)
+            )
+            # Fallback to basic categorization
+            return self._fallback_categorization(issue)
+
+    def _parse_analysis(
+        self, issue: Issue, response: dict[str, Any], tokens_used: int
+    ) -> IssueAnalysis:
+        """Build an IssueAnalysis from one issue's LLM JSON answer."""
+        category_str = response.get("category", "unknown")
+        category = IssueCategory.from_string(category_str)
+
+        # Map complexity to 1-10 range
+        complexity = max(1, min(10, int(response.get("complexity", 5))))
+
+        solvability = max(0.0, min(1.0, float(response.get("solvability", 0.5))))
+
+        breaking_change = bool(response.get("breaking_change", False))
+        test_required = bool(response.get("test_required", True))
+
+        analysis = IssueAnalysis(
+            category=category,
+            complexity=complexity,
+            solvability=solvability,
+            breaking_change=breaking_change,
+            test_required=test_required,
+            tokens_used=tokens_used,
+        )
+
+        logger.info(
+            "issue_categorized",
+            repo=issue.repository,
+            number=issue.number,
+            category=category.value,
+            complexity=complexity,
+            solvability=f"{solvability:.2f}",
+        )
+
+        return analysis
+
+    @staticmethod
+    def _issue_prompt(issue: Issue) -> str:
+        """Build the single-issue categorization prompt."""
+        return format_issue_categorization_prompt(
             title=issue.title,
             body=issue.body or "",
             labels=issue.labels,
@@ -68,47 +142,159 @@ class IssueAnalyzer:
             reactions=issue.reactions,
         )
 
-        try:
-            response = self.llm.complete_json(prompt)
+    def _cache_key(self, prompt: str) -> str:
+        """Key a cached response by the model and the full prompt."""
+        return sha256(f"{self.llm.model}\0{prompt}".encode()).hexdigest()[:16]
 
-            # Parse response
-            category_str = response.get("category", "unknown")
-            category = IssueCategory.from_string(category_str)
+    def _load_cached(self, prompt: str) -> dict[str, Any] | None:
+        """Return the unexpired cached response for a prompt, if any.
 
-            # Map complexity to 1-10 range
-            complexity = max(1, min(10, int(response.get("complexity", 5))))
+        A cached response reports no tokens used.
+        """
+        key = self._cache_key(prompt)
+        path = self.cache_dir / f"{key}.json"
+        try:
+            entry = json.loads(path.read_text())
+            if time.time() - entry["created_at"] < self.cache_ttl_hours * 3600:
+                logger.debug("llm_cache_hit", key=key)
+                return {**entry["response"], "tokens_used": 0}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("llm_cache_load_failed", key=key, error=str(e))
+        logger.debug("llm_cache_miss", key=key)
+        return None
+
+    def _save_cached(self, prompt: str, response: dict[str, Any]) -> None:
+        """Store the response for a prompt."""
+        key = self._cache_key(prompt)
+        path = self.cache_dir / f"{key}.json"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                json.dumps({"created_at": time.time(), "response": response})
+            )
+        except Exception as e:
+            logger.warning("llm_cache_save_failed", key=key, error=str(e))
 
-            solvability = max(0.0, min(1.0, float(response.get("solvability", 0.5))))
+    def _complete_json_cached(self, prompt: str) -> dict[str, Any]:
+        """Complete a JSON prompt, reusing the response for an identical prompt.
 
-            breaking_change = bool(response.get("breaking_change", False))
-            test_required = bool(response.get("test_required", True))
+        The key covers the model and the full prompt, so any change to the
+        issue's title, body, labels or engagement asks the LLM again.
+        """
+        if not self.use_cache:
+            return self.llm.complete_json(prompt)
+
+        cached = self._load_cached(prompt)
+        if cached is not None:
+            return cached
+        response = self.llm.complete_json(prompt)
+        self._save_cached(prompt, response)
+        return response
+
+    def categorize_issues_batched(
+        self, issues: list[Issue], batch_size: int = 10, max_workers: int = 8
+    ) -> list[IssueAnalysis]:
+        """Categorize issues several at a time, one LLM request per batch.
+
+        Packing ``batch_size`` issues into a prompt cuts the number of
+        requests and the repeated instructions each one carries. Caching
+        stays per issue: issues with a cached single-issue answer are not
+        sent, and each batch answer is stored under its issue's own key,
+        so re-runs only ask about new or edited issues. Issues missing
+        from a batch answer, or whose batch fails, are categorized on
+        their own with ``categorize_issue``.
 
-            analysis = IssueAnalysis(
-                category=category,
-                complexity=complexity,
-                solvability=solvability,
-                breaking_change=breaking_change,
-                test_required=test_required,
-                tokens_used=response.get("tokens_used", 0),
-            )
+        Args:
+            issues: Issues to categorize
+            batch_size: Issues per LLM request
+            max_workers: Maximum number of requests in flight
 
-            logger.info(
-                "issue_categorized",
-                repo=issue.repository,
-                number=issue.number,
-                category=category.value,
-                complexity=complexity,
-                solvability=f"{solvability:.2f}",
+        Returns:
+            IssueAnalysis per issue, in input order
+        """
+        results: dict[int, IssueAnalysis] = {}
+        misses = []
+        for i, issue in enumerate(issues):
+            cached = (
+                self._load_cached(self._issue_prompt(issue)) if self.use_cache else None
             )
+            if cached is None:
+                misses.append((i, issue))
+                continue
+            try:
+                results[i] = self._parse_analysis(issue, cached, 0)
+            except (TypeError, ValueError) as e:
+                logger.warning(
+                    "llm_cache_entry_invalid", issue=issue.number, error=str(e)
+                )
+                misses.append((i, issue))
+
+        batches = [
+            [issue for _, issue in misses[i : i + batch_size]]
+            for i in range(0, len(misses), batch_size)
+        ]
+        if len(batches) <= 1:
+            answered = [self._categorize_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(batches))
+            ) as executor:
+                answered = list(executor.map(self._categorize_batch, batches))
+
+        analyses = (analysis for batch in answered for analysis in batch)
+        for (i, _), analysis in zip(misses, analyses):
+            results[i] = analysis
+        return [results[i] for i in range(len(issues))]
+
+    def _categorize_batch(self, issues: list[Issue]) -> list[IssueAnalysis]:
+        """Categorize one batch of issues with a single prompt.
+
+        The batch prompt itself is not cached; each parsed answer is
+        stored under its issue's single-issue key instead.
+        """
+        if len(issues) == 1:
+            return [self.categorize_issue(issues[0])]
 
-            return analysis
-
-        except Exception as e:
-            logger.warning(
-                "llm_categorization_failed", issue=issue.number, error=str(e)
+        logger.info(
+            "categorizing_issue_batch",
+            repo=issues[0].repository,
+            count=len(issues),
+        )
+        try:
+            response = self.llm.complete_json(
+                format_issue_batch_categorization_prompt(issues)
             )
-            # Fallback to basic categorization
-            return self._fallback_categorization(issue)
+            # Numbers may come back as strings; match them either way
+            answers = {
+                str(item.get("number")): item
+                for item in response.get("issues", [])
+                if isinstance(item, dict)
+            }
+        except Exception as e:
+            logger.warning("llm_batch_categorization_failed", error=str(e))
+            answers = {}
+            response = {}
+
+        # Spread the batch's token cost over the issues it answered
+        tokens_each = response.get("tokens_used", 0) // max(len(answers), 1)
+        results = []
+        for issue in issues:
+            answer = answers.get(str(issue.number))
+            if answer is not None:
+                try:
+                    results.append(self._parse_analysis(issue, answer, tokens_each))
+                except (TypeError, ValueError) as e:
+                    logger.warning(
+                        "llm_batch_answer_invalid", issue=issue.number, error=str(e)
+                    )
+                else:
+                    if self.use_cache:
+                        self._save_cached(self._issue_prompt(issue), answer)
+                    continue
+            results.append(self.categorize_issue(issue))
+        return results
 
     def estimate_complexity(self, issue: Issue) -> int:
         """Estimate issue complexity without full LLM call.
@@ -1,5 +1,11 @@
 """GitHub issue fetching."""
 
+import json
+from hashlib import sha256
+from pathlib import Path
+
+from github.Issue import Issue as GithubIssue
+
 from globallm.logging_config import get_logger
 from globallm.models.issue import Issue
 
@@ -9,13 +15,25 @@ logger = get_logger(__name__)
 class IssueFetcher:
     """Fetch issues from GitHub repositories."""
 
-    def __init__(self, github_client) -> None:
+    CACHE_DIR = Path.home() / ".cache" / "globallm" / "issues"
+
+    def __init__(
+        self,
+        github_client,
+        cache_dir: Path | None = None,
+        use_cache: bool = True,
+    ) -> None:
         """Initialize with a GitHub client.
 
         Args:
             github_client: PyGithub Github instance
+            cache_dir: Directory for cached issue payloads and their ETags
+            use_cache: Whether to revalidate cached issues instead of
+                refetching them
         """
         self.github = github_client
+        self.cache_dir = cache_dir or self.CACHE_DIR
+        self.use_cache = use_cache
 
     def fetch_repo_issues(
         self,
@@ -138,6 +156,10 @@ class IssueFetcher:
     def fetch_single_issue(self, repo_name: str, issue_number: int) -> Issue:
         """Fetch a single issue by number.
 
+        A previously fetched issue is requested with its cached ETag; a
+        304 reply, which does not count against the rate limit, reuses
+        the cached payload.
+
         Args:
             repo_name: Repository name (owner/repo)
             issue_number: Issue number
@@ -148,9 +170,7 @@ class IssueFetcher:
         logger.info("fetching_single_issue", repo=repo_name, number=issue_number)
 
         try:
-            repo = self.github.get_repo(repo_name)
-            issue = repo.get_issue(issue_number)
-
+            issue = self._get_issue(repo_name, issue_number)
             return Issue.from_github_issue(issue, repo_name)
 
         except Exception as e:
@@ -161,3 +181,39 @@ class IssueFetcher:
                 error=str(e),
             )
             raise
+
+    def _get_issue(self, repo_name: str, issue_number: int) -> GithubIssue:
+        """Fetch an issue directly, revalidating any cached copy by ETag."""
+        url = f"/repos/{repo_name}/issues/{issue_number}"
+        path = self.cache_dir / f"{sha256(url.encode()).hexdigest()[:16]}.json"
+        cached = self._load_cached(path)
+
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+        response_headers, data = self.github.requester.requestJsonAndCheck(
+            "GET", url, headers=headers
+        )
+        if data is None:
+            logger.debug("issue_not_modified", repo=repo_name, number=issue_number)
+            data = cached["data"]
+        elif self.use_cache and response_headers.get("etag"):
+            self._save_cached(path, {"etag": response_headers["etag"], "data": data})
+
+        return self.github.create_from_raw_data(GithubIssue, data, response_headers)
+
+    def _load_cached(self, path: Path) -> dict | None:
+        """Load a cached issue payload, if caching is enabled and one exists."""
+        if not self.use_cache or not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except Exception as e:
+            logger.warning("issue_cache_load_failed", path=str(path), error=str(e))
+            return None
+
+    def _save_cached(self, path: Path, entry: dict) -> None:
+        """Save an issue payload with its ETag."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(entry))
+        except Exception as e:
+            logger.warning("issue_cache_save_failed", path=str(path), error=str(e))
@@ -1,5 +1,10 @@
 """Prompt templates for LLM interactions."""
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from globallm.models.issue import Issue
+
 ISSUE_CATEGORIZATION_PROMPT = """You are an issue classifier for open-source repositories.
 Analyze the following GitHub issue and provide a JSON response with:
 1. category: One of {categories}
@@ -19,6 +24,33 @@ Respond only with valid JSON, no markdown.
 """
 
 
+ISSUE_BATCH_CATEGORIZATION_PROMPT = """You are an issue classifier for open-source repositories.
+Analyze each of the following GitHub issues and provide a JSON response of the form
+{{"issues": [...]}} with one object per issue, containing:
+1. number: The issue number, as given below
+2. category: One of {categories}
+3. complexity: An integer from 1-10 (1=trivial, 10=architectural change)
+4. solvability: A float from 0-1 (probability of successful automated fix)
+5. breaking_change: Boolean (whether this change breaks public API)
+6. test_required: Boolean (whether tests should be created/modified)
+
+{issues}
+Respond only with valid JSON, no markdown.
+"""
+
+ISSUE_BATCH_ENTRY = """Issue #{number}:
+Title: {title}
+Body: {body}
+Labels: {labels}
+Comments: {comment_count}
+Reactions: {reactions}
+"""
+
+# Longest issue body included in a batch prompt, so one long issue cannot
+# crowd out the rest of the batch
+MAX_BATCH_BODY_CHARS = 2000
+
+
 ISSUE_COMPLEXITY_PROMPT = """Estimate the complexity of implementing a fix for this GitHub issue.
 
 Consider:
@@ -130,6 +162,28 @@ def format_issue_categorization_prompt(
     )
 
 
+def format_issue_batch_categorization_prompt(
+    issues: list[Issue],
+    categories: str = "critical_security, bug_critical, bug, feature, enhancement, documentation, style, refactor, performance, tests",
+) -> str:
+    """Format the prompt categorizing several issues in one request."""
+    entries = "\n".join(
+        ISSUE_BATCH_ENTRY.format(
+            number=issue.number,
+            title=issue.title,
+            body=(issue.body or "")[:MAX_BATCH_BODY_CHARS]
+            or "No description provided.",
+            labels=", ".join(issue.labels) if issue.labels else "none",
+            comment_count=issue.comments_count,
+            reactions=str(issue.reactions) if issue.reactions else "{}",
+        )
+        for issue in issues
+    )
+    return ISSUE_BATCH_CATEGORIZATION_PROMPT.format(
+        issues=entries, categories=categories
+    )
+
+
 def format_complexity_prompt(repo: str, title: str, body: str) -> str:
     """Format the complexity estimation prompt."""
     return ISSUE_COMPLEXITY_PROMPT.format(
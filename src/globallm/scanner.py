@@ -1,14 +1,20 @@
 """GitHub repository scanner."""
 
+from collections.abc import Sequence
+from typing import Any, Self
+from concurrent.futures import ThreadPoolExecutor
 from github import Github
+from github.ContentFile import ContentFile
 from github.Repository import Repository
 from github.GithubException import GithubException
 from dataclasses import dataclass, asdict
 from enum import Enum
 from pathlib import Path
 from hashlib import sha256
+import time
 import yaml
 
+from globallm.github import GitHubClientPool, create_github_client
 from globallm.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -86,19 +92,34 @@ class RepoMetrics:
 class CacheEntry:
     """Cache entry for search results."""
 
-    def __init__(self, results: list[RepoMetrics], ttl_hours: int = 24) -> None:
+    def __init__(
+        self,
+        results: list[RepoMetrics],
+        ttl_hours: int = 24,
+        created_at: float | None = None,
+        etag: str | None = None,
+    ) -> None:
         self.results = results
         self.ttl_hours = ttl_hours
+        self.created_at = time.time() if created_at is None else created_at
+        self.etag = etag
 
-    def is_expired(self) -> bool:
-        """Check if cache entry is expired."""
-        return False
+    def is_expired(self, ttl_hours: int | None = None) -> bool:
+        """Check if cache entry is expired.
+
+        Args:
+            ttl_hours: Override for the TTL stored with the entry
+        """
+        ttl = self.ttl_hours if ttl_hours is None else ttl_hours
+        return time.time() - self.created_at >= ttl * 3600
 
     def to_dict(self) -> dict:
         """Convert to dictionary for YAML serialization."""
         return {
             "results": [r.to_dict() for r in self.results],
             "ttl_hours": self.ttl_hours,
+            "created_at": self.created_at,
+            "etag": self.etag,
         }
 
     @classmethod
@@ -107,6 +128,9 @@ class CacheEntry:
         return cls(
             results=[RepoMetrics.from_dict(r) for r in data["results"]],
             ttl_hours=data.get("ttl_hours", 24),
+            # Entries written before timestamps were recorded count as stale
+            created_at=data.get("created_at", 0.0),
+            etag=data.get("etag"),
         )
 
 
@@ -115,12 +139,16 @@ class GitHubScanner:
 
     CACHE_DIR = Path.home() / ".cache" / "globallm"
     DEFAULT_CACHE_TTL_HOURS = 24
+    # GitHub requests in flight at once for per-repo checks
+    MAX_CONCURRENT_REQUESTS = 8
 
     def __init__(
         self,
         github_client: Github,
         cache_dir: Path | None = None,
         use_cache: bool = True,
+        cache_ttl_hours: int = DEFAULT_CACHE_TTL_HOURS,
+        pool: GitHubClientPool | None = None,
     ) -> None:
         """Initialize scanner with a GitHub client.
 
@@ -128,16 +156,45 @@ class GitHubScanner:
             github_client: PyGithub Github instance
             cache_dir: Optional cache directory
             use_cache: Whether to use caching
+            cache_ttl_hours: How long cached GitHub results stay valid
+            pool: Optional client pool; requests then rotate across a
+                client per token
         """
-        self.github = github_client
+        self._github = github_client
+        self._pool = pool
         self.authenticated = bool(github_client)  # TODO: proper check
         self.cache_dir = cache_dir or self.CACHE_DIR
         self.use_cache = use_cache
+        self.cache_ttl_hours = cache_ttl_hours
         if self.authenticated:
             logger.debug("scanner_initialized", authenticated=True)
         else:
             logger.debug("scanner_initialized", authenticated=False)
 
+    @classmethod
+    def from_tokens(cls, tokens: Sequence[str], **kwargs: Any) -> Self:
+        """Create a scanner with a client for each configured token.
+
+        With several tokens the pool's first client doubles as the
+        scanner's own, so no token gets a second session.
+
+        Args:
+            tokens: GitHub API tokens; empty for unauthenticated access
+            **kwargs: Other scanner options (cache_dir, use_cache,
+                cache_ttl_hours)
+        """
+        if len(tokens) > 1:
+            pool = GitHubClientPool(tokens)
+            return cls(pool.clients[0], pool=pool, **kwargs)
+        return cls(create_github_client(tokens[0] if tokens else None), **kwargs)
+
+    @property
+    def github(self) -> Github:
+        """Client for the next request, rotating across the token pool."""
+        if self._pool is not None:
+            return self._pool.next_client()
+        return self._github
+
     def _cache_key(self, *args: str | int | None) -> str:
         """Generate cache key from arguments."""
         key_str = "|".join(str(a) for a in args if a is not None)
@@ -148,8 +205,14 @@ class GitHubScanner:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         return self.cache_dir / f"{key}.yaml"
 
-    def _load_cache(self, key: str) -> CacheEntry | None:
-        """Load cached results if available."""
+    def _load_cache(self, key: str, include_expired: bool = False) -> CacheEntry | None:
+        """Load cached results if available.
+
+        Args:
+            key: Cache key
+            include_expired: Also return entries past their TTL, e.g. to
+                revalidate them with their ETag
+        """
         if not self.use_cache:
             return None
         path = self._cache_path(key)
@@ -159,7 +222,7 @@ class GitHubScanner:
             with path.open() as f:
                 data = yaml.safe_load(f)
                 entry = CacheEntry.from_dict(data)
-                if not entry.is_expired():
+                if include_expired or not entry.is_expired(self.cache_ttl_hours):
                     logger.debug("cache_hit", key=key)
                     return entry
         except Exception as e:
@@ -186,10 +249,30 @@ class GitHubScanner:
             logger.info("cache_cleared")
 
     def analyze_repo(self, repo_name: str) -> RepoMetrics:
-        """Analyze a single repository."""
+        """Analyze a single repository.
+
+        Cached metrics are returned while fresh. Once they expire, the
+        repository is requested with the cached ETag; a 304 reply, which
+        does not count against the rate limit, just renews the entry.
+        """
+        key = self._cache_key("repo", repo_name)
+        cached = self._load_cache(key, include_expired=True)
+        if cached and not cached.results:
+            cached = None
+        if cached and not cached.is_expired(self.cache_ttl_hours):
+            return cached.results[0]
+
         logger.debug("analyzing_repo", repo=repo_name)
         try:
-            repo = self.github.get_repo(repo_name)
+            repo = self._get_repo(repo_name, etag=cached.etag if cached else None)
+            if repo is None:
+                logger.debug("repo_not_modified", repo=repo_name)
+                self._save_cache(
+                    key,
+                    CacheEntry(cached.results, self.cache_ttl_hours, etag=cached.etag),
+                )
+                return cached.results[0]
+
             metrics = self._calculate_metrics(repo)
             logger.debug(
                 "repo_analyzed",
@@ -197,11 +280,41 @@ class GitHubScanner:
                 stars=metrics.stars,
                 score=f"{metrics.score:.1f}",
             )
+            self._save_cache(
+                key, CacheEntry([metrics], self.cache_ttl_hours, etag=repo.etag)
+            )
             return metrics
         except GithubException as e:
             logger.error("repo_analysis_failed", repo=repo_name, error=str(e))
             raise
 
+    def _get_repo(self, repo_name: str, etag: str | None = None) -> Repository | None:
+        """Fetch a repository, conditionally on a previously seen ETag.
+
+        Returns:
+            The repository, or None if GitHub answered 304 Not Modified
+        """
+        client = self.github
+        headers = {"If-None-Match": etag} if etag else None
+        response_headers, data = client.requester.requestJsonAndCheck(
+            "GET", f"/repos/{repo_name}", headers=headers
+        )
+        if data is None:
+            return None
+        return client.create_from_raw_data(Repository, data, response_headers)
+
+    def get_readme(self, repo_name: str) -> ContentFile:
+        """Fetch a repository's README.
+
+        Requests the README endpoint directly instead of loading the
+        repository first, saving a round trip.
+        """
+        client = self.github
+        headers, data = client.requester.requestJsonAndCheck(
+            "GET", f"/repos/{repo_name}/readme"
+        )
+        return client.create_from_raw_data(ContentFile, data, headers)
+
     def search_repos(
         self,
         query: str,
@@ -283,7 +396,7 @@ class GitHubScanner:
         results = sorted(results, key=lambda r: r.score, reverse=True)
         logger.debug("results_sorted", count=len(results))
 
-        self._save_cache(key, CacheEntry(results))
+        self._save_cache(key, CacheEntry(results, self.cache_ttl_hours))
 
         if results:
             logger.info(
@@ -504,18 +617,14 @@ class GitHubScanner:
         """Filter results to only include libraries."""
         logger.info("filtering_libraries", total=len(results))
 
-        filtered = []
-        for metrics in results:
-            try:
-                repo = self.github.get_repo(metrics.name)
-                if self.is_library(repo):
-                    filtered.append(metrics)
-                else:
-                    logger.debug("filtered_non_library", repo=metrics.name)
-            except GithubException as e:
-                logger.warning("filter_check_failed", repo=metrics.name, error=str(e))
-                # Keep it if we can't check
-                filtered.append(metrics)
+        # Each check costs several GitHub round trips; overlap them
+        if len(results) > 1:
+            workers = min(self.MAX_CONCURRENT_REQUESTS, len(results))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                keep = list(executor.map(self._check_library, results))
+        else:
+            keep = [self._check_library(metrics) for metrics in results]
+        filtered = [metrics for metrics, kept in zip(results, keep) if kept]
 
         logger.info(
             "libraries_filtered",
@@ -524,6 +633,19 @@ class GitHubScanner:
         )
         return filtered
 
+    def _check_library(self, metrics: RepoMetrics) -> bool:
+        """Check whether a search result is a library, keeping it on errors."""
+        try:
+            repo = self.github.get_repo(metrics.name)
+            if self.is_library(repo):
+                return True
+            logger.debug("filtered_non_library", repo=metrics.name)
+            return False
+        except GithubException as e:
+            logger.warning("filter_check_failed", repo=metrics.name, error=str(e))
+            # Keep it if we can't check
+            return True
+
     def _calculate_metrics(self, repo: Repository) -> RepoMetrics:
         """Calculate impact score for a repository."""
         # Weighted score formula
@@ -10,7 +10,7 @@ from globallm.storage.db import get_connection
 logger = get_logger(__name__)
 
 # Schema version for future migrations
-SCHEMA_VERSION = 2
+SCHEMA_VERSION = 3
 
 # Migration definitions
 # Each migration is a (from_version, to_version, description, sql_function) tuple
@@ -47,6 +47,9 @@ CREATE INDEX IF NOT EXISTS idx_issues_data ON issues USING GIN (data);
 CREATE INDEX IF NOT EXISTS idx_issues_assignment_status ON issues(assignment_status);
 CREATE INDEX IF NOT EXISTS idx_issues_assigned_to ON issues(assigned_to);
 CREATE INDEX IF NOT EXISTS idx_issues_last_heartbeat ON issues(last_heartbeat_at);
+CREATE INDEX IF NOT EXISTS idx_issues_assigned_priority
+    ON issues (((data->>'priority')::numeric) DESC)
+    WHERE assignment_status = 'assigned';
 
 -- Repositories table
 CREATE TABLE IF NOT EXISTS repositories (
@@ -191,8 +194,28 @@ def migrate_1_to_2() -> None:
     logger.info("migration_1_to_2_completed")
 
 
+def migrate_2_to_3() -> None:
+    """Migration from schema version 2 to 3.
+
+    Adds a partial index serving the priority-ordered listing of assigned
+    issues.
+    """
+    sql = """
+    CREATE INDEX IF NOT EXISTS idx_issues_assigned_priority
+        ON issues (((data->>'priority')::numeric) DESC)
+        WHERE assignment_status = 'assigned';
+    """
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql)
+        conn.commit()
+    logger.info("migration_2_to_3_completed")
+
+
 # Register migrations
 MIGRATIONS.append((1, 2, "Add issue assignment tracking", migrate_1_to_2))
+MIGRATIONS.append((2, 3, "Index assigned issues by priority", migrate_2_to_3))
 
 
 def get_pending_migrations() -> list[tuple[int, int, str, Any]]:
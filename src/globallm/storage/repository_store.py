@@ -14,6 +14,35 @@ logger = get_logger(__name__)
 # Special repository that must always be present and approved
 _OWN_REPO = "TomzxCode/globallm"
 
+_UPSERT_SQL = """
+    INSERT INTO repositories (name, data, worth_working_on, analyzed_at)
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (name)
+    DO UPDATE SET data = EXCLUDED.data,
+                  worth_working_on = EXCLUDED.worth_working_on,
+                  analyzed_at = EXCLUDED.analyzed_at,
+                  updated_at = NOW()
+"""
+
+# WHERE clauses for get_top_repositories, keyed by analysis status
+_STATUS_CONDITIONS = {
+    "all": "TRUE",
+    "approved": "worth_working_on = TRUE",
+    "rejected": "worth_working_on = FALSE",
+    "unanalyzed": "worth_working_on IS NULL",
+}
+
+
+def _upsert_params(repo_dict: dict[str, Any]) -> tuple[Any, ...]:
+    """Build the _UPSERT_SQL parameters for a repository dictionary."""
+    analyzed_at = repo_dict.get("analyzed_at")
+    return (
+        repo_dict.get("name"),
+        Json(repo_dict),
+        repo_dict.get("worth_working_on"),
+        datetime.fromisoformat(analyzed_at) if analyzed_at else None,
+    )
+
 
 class RepositoryStore:
     """Persistent storage for discovered and analyzed repositories using PostgreSQL."""
@@ -258,28 +287,7 @@ class RepositoryStore:
         try:
             with get_connection() as conn:
                 with conn.cursor() as cur:
-                    worth_working_on = repo_dict.get("worth_working_on")
-                    analyzed_at = repo_dict.get("analyzed_at")
-
-                    cur.execute(
-                        """
-                        INSERT INTO repositories (name, data, worth_working_on, analyzed_at)
-                        VALUES (%s, %s, %s, %s)
-                        ON CONFLICT (name)
-                        DO UPDATE SET data = EXCLUDED.data,
-                                      worth_working_on = EXCLUDED.worth_working_on,
-                                      analyzed_at = EXCLUDED.analyzed_at,
-                                      updated_at = NOW()
-                    """,
-                        (
-                            repo_dict.get("name"),
-                            Json(repo_dict),
-                            worth_working_on,
-                            datetime.fromisoformat(analyzed_at)
-                            if analyzed_at
-                            else None,
-                        ),
-                    )
+                    cur.execute(_UPSERT_SQL, _upsert_params(repo_dict))
 
                 conn.commit()
                 logger.debug("added_or_updated_repository", name=repo_dict.get("name"))
@@ -291,6 +299,32 @@ class RepositoryStore:
             )
             raise
 
+    def add_or_update_many(self, repo_dicts: list[dict[str, Any]]) -> None:
+        """Add or update several repositories in a single transaction.
+
+        Args:
+            repo_dicts: Repository dictionaries to add or update.
+        """
+        if not repo_dicts:
+            return
+
+        try:
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.executemany(
+                        _UPSERT_SQL, [_upsert_params(repo) for repo in repo_dicts]
+                    )
+
+                conn.commit()
+                logger.debug("added_or_updated_repositories", count=len(repo_dicts))
+        except Exception as e:
+            logger.error(
+                "failed_to_add_or_update_repositories",
+                count=len(repo_dicts),
+                error=str(e),
+            )
+            raise
+
     def get_approved(self) -> list[dict[str, Any]]:
         """Get repositories marked as worth working on.
 
@@ -354,6 +388,44 @@ class RepositoryStore:
             logger.error("failed_to_get_unanalyzed", error=str(e))
             return []
 
+    def get_top_repositories(
+        self, status: str = "all", limit: int = 50
+    ) -> list[dict[str, Any]]:
+        """Get the most-starred repositories with a given analysis status.
+
+        Args:
+            status: One of all, approved, rejected or unanalyzed.
+            limit: Maximum number of repositories to return.
+
+        Returns:
+            List of repository dictionaries sorted by stars (descending).
+        """
+        condition = _STATUS_CONDITIONS.get(status)
+        if condition is None:
+            raise ValueError(f"Unknown repository status: {status}")
+
+        if status == "all":
+            # Ensure own repo is always present with worth_working_on=True
+            self._ensure_own_repo()
+
+        try:
+            with get_connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
+                    cur.execute(
+                        f"""
+                        SELECT data FROM repositories
+                        WHERE {condition}
+                        ORDER BY (data->>'stars')::numeric DESC NULLS LAST
+                        LIMIT %s
+                    """,
+                        (limit,),
+                    )
+                    results = cur.fetchall()
+                    return [row["data"] for row in results]
+        except Exception as e:
+            logger.error("failed_to_get_top_repositories", status=status, error=str(e))
+            return []
+
     def delete_repository(self, name: str) -> bool:
         """Delete a repository from storage.
 
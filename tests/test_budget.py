@@ -88,6 +88,28 @@ class TestBudgetManager:
         unique_repo = "unique/test/repo"
         assert manager.can_process_repo(unique_repo, 500)
 
+    def test_filter_processable(self) -> None:
+        """Test filtering repos matches per-repo checks."""
+        state = BudgetState()
+        state.record_repo_tokens("busy/repo", 900)
+        manager = BudgetManager(
+            limits=BudgetLimits(max_tokens_per_repo=1000), state=state
+        )
+        repos = ["free/repo", "busy/repo", "other/repo"]
+        assert manager.filter_processable(repos, 500) == ["free/repo", "other/repo"]
+
+    def test_get_top_repos(self) -> None:
+        """Test top repositories are ordered by token usage."""
+        state = BudgetState()
+        state.record_repo_tokens("small/repo", 10)
+        state.record_repo_tokens("big/repo", 500)
+        state.record_repo_tokens("mid/repo", 100)
+        manager = BudgetManager(state=state)
+
+        top = manager.get_top_repos(2)
+        assert [repo for repo, _ in top] == ["big/repo", "mid/repo"]
+        assert top[0][1]["tokens"] == 500
+
     def test_get_report(self) -> None:
         """Test getting budget report."""
         manager = BudgetManager()
@@ -0,0 +1,22 @@
+"""Tests for the root CLI - green path tests."""
+
+import pytest
+import typer
+from typer.models import DefaultPlaceholder
+
+from globallm.cli.cli import _COMMANDS, app
+
+
+@pytest.mark.parametrize("name", list(_COMMANDS))
+def test_static_listing_matches_loaded_command(name: str) -> None:
+    """Test root --help shows the same help and panel as the loaded command."""
+    _, help_text, panel = _COMMANDS[name]
+    group = typer.main.get_group(app)
+
+    cmd = group._load(name)
+
+    loaded_panel = cmd.rich_help_panel
+    if isinstance(loaded_panel, DefaultPlaceholder):
+        loaded_panel = loaded_panel.value
+    assert cmd.get_short_help_str(limit=200) == help_text
+    assert loaded_panel == panel
@@ -0,0 +1,145 @@
+"""Tests for configuration loading - green path tests."""
+
+import os
+from pathlib import Path
+
+import pytest
+import typer
+import yaml
+
+from globallm.cli import config as config_cli
+from globallm.cli.config import _parse_value
+from globallm.config import loader
+from globallm.config.defaults import DEFAULT_CONFIG
+from globallm.config.loader import load_config, save_config, set_config_path
+
+
+class TestLoadConfig:
+    """Test config loading and caching."""
+
+    def test_reuses_parsed_settings(self, tmp_path: Path) -> None:
+        """Test repeated loads of an unchanged file return the cached settings."""
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump({"filters": {"min_stars": 42}}))
+
+        first = load_config(path)
+        assert first.filters.min_stars == 42
+        assert load_config(path) is first
+
+    def test_reloads_after_edit(self, tmp_path: Path) -> None:
+        """Test an edited file is parsed again."""
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump({"filters": {"min_stars": 42}}))
+        first = load_config(path)
+
+        path.write_text(yaml.dump({"filters": {"min_stars": 7}}))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config(path).filters.min_stars == 7
+        assert first.filters.min_stars == 42
+
+    def test_save_invalidates_cache(self, tmp_path: Path) -> None:
+        """Test saving a config makes the next load read it back."""
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump({"filters": {"min_stars": 42}}))
+        settings = load_config(path)
+
+        settings.filters.min_stars = 99
+        save_config(settings, path)
+
+        assert load_config(path).filters.min_stars == 99
+
+    def test_default_path_follows_set_config_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a path-less load reads the file chosen with set_config_path."""
+        monkeypatch.setattr(loader, "_config_path", None)
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump({"filters": {"min_stars": 42}}))
+
+        set_config_path(path)
+
+        assert load_config().filters.min_stars == 42
+        assert load_config() is load_config(path)
+
+    def test_missing_file_uses_defaults(self, tmp_path: Path) -> None:
+        """Test a missing file yields defaults that are safe to modify."""
+        settings = load_config(tmp_path / "config.yaml")
+        settings.filters.min_stars = 1
+
+        assert DEFAULT_CONFIG.filters.min_stars == 1000
+        assert (tmp_path / "config.yaml").exists()
+
+
+class TestParseValue:
+    """Test parsing of config set values."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("42", 42),
+            ("-5", -5),
+            ("0.5", 0.5),
+            ("1e3", 1000.0),
+            ("0", 0),
+            ("yes", True),
+            ("False", False),
+            ("inf", "inf"),
+            ("gpt-4o", "gpt-4o"),
+        ],
+    )
+    def test_parses_value(self, value: str, expected: object) -> None:
+        """Test values parse as int, float, bool or str."""
+        parsed = _parse_value(value)
+        assert parsed == expected
+        assert type(parsed) is type(expected)
+
+
+class TestConfigCommands:
+    """Test config show and set key resolution."""
+
+    @pytest.fixture
+    def config_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump({"filters": {"min_stars": 42}}))
+        monkeypatch.setattr(loader, "_config_path", path)
+        return path
+
+    def test_show_resolves_fields_and_dict_keys(
+        self, config_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test show follows model fields and dict-valued settings."""
+        config_cli.show(key="filters.min_stars")
+        config_cli.show(key="issue_categories.feature.multiplier")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "filters.min_stars: 42" in lines
+        assert "issue_categories.feature.multiplier: 2.0" in lines
+
+    @pytest.mark.parametrize(
+        "key", ["model_dump", "model_config", "filters.model_copy", "model_config.x"]
+    )
+    def test_show_rejects_model_attributes(self, config_path: Path, key: str) -> None:
+        """Test model methods and pydantic config are not config keys."""
+        with pytest.raises(typer.Exit):
+            config_cli.show(key=key)
+
+    def test_set_updates_field(self, config_path: Path) -> None:
+        """Test set writes a declared field back to the file."""
+        config_cli.set(key="filters.min_stars", value="7")
+
+        assert load_config(config_path).filters.min_stars == 7
+
+    @pytest.mark.parametrize(
+        "key", ["model_dump", "model_config.x", "filters.model_copy", "filters.nope"]
+    )
+    def test_set_rejects_model_attributes(self, config_path: Path, key: str) -> None:
+        """Test set refuses keys that are not settings and leaves the file alone."""
+        before = config_path.read_text()
+
+        with pytest.raises(typer.Exit):
+            config_cli.set(key=key, value="1")
+
+        assert config_path.read_text() == before
+        assert "x" not in loader.Settings.model_config
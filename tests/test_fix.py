@@ -0,0 +1,136 @@
+"""Tests for the fix command - green path tests."""
+
+import pytest
+import typer
+
+from globallm.budget import budget_manager
+from globallm.budget.budget_manager import BudgetLimits, BudgetManager
+from globallm.budget.state import BudgetState
+from globallm.cli import fix
+from globallm.storage import issue_store
+
+
+class _IssueStore:
+    """Hands out queued issues and records releases."""
+
+    def __init__(self, issues: list[tuple[str, int]]) -> None:
+        self.available = list(issues)
+        self.released: list[tuple[str, int, str]] = []
+
+    def claim_next_available_issue(self, agent_id: str) -> dict | None:
+        if not self.available:
+            return None
+        repo, number = self.available.pop(0)
+        return {"repository": repo, "number": number}
+
+    def release_issue(
+        self, repository: str, number: int, agent_id: str, status: str = "available"
+    ) -> None:
+        self.released.append((repository, number, status))
+
+    def send_heartbeat(self, repository: str, number: int, agent_id: str) -> bool:
+        return True
+
+
+@pytest.fixture
+def processed(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, int]]:
+    """Replace issue processing with a stub that records and prints."""
+    calls: list[tuple[str, int]] = []
+
+    def process_issue(repo, issue_number, *args) -> None:
+        calls.append((repo, issue_number))
+        rprint = args[-1]
+        rprint("\nPhase 1: Analyzing issue...")
+
+    monkeypatch.setattr(fix, "_process_issue", process_issue)
+    return calls
+
+
+def _budget_for(issues: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make BudgetManager() allow exactly ``issues`` fixes this week."""
+    weekly = issues * fix._ESTIMATED_FIX_TOKENS
+    monkeypatch.setattr(
+        budget_manager,
+        "BudgetManager",
+        lambda: BudgetManager(
+            limits=BudgetLimits(weekly_token_budget=weekly),
+            state=BudgetState(weekly_budget=weekly),
+        ),
+    )
+
+
+class TestFixAvailableParallel:
+    """Test fixing several available issues at once."""
+
+    def test_claims_only_what_the_budget_covers(
+        self, processed: list, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test claims beyond the budget are released instead of processed."""
+        _budget_for(1, monkeypatch)
+        store = _IssueStore([("a/one", 1), ("b/two", 2), ("c/three", 3)])
+
+        fix._fix_available_parallel(store, None, 3, True, False, "main")
+
+        assert processed == [("a/one", 1)]
+        assert sorted(store.released) == [
+            ("a/one", 1, "completed"),
+            ("b/two", 2, "available"),
+            ("c/three", 3, "available"),
+        ]
+
+    def test_exits_when_budget_covers_nothing(
+        self, processed: list, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test every claim is released and the command fails without budget."""
+        _budget_for(0, monkeypatch)
+        store = _IssueStore([("a/one", 1)])
+
+        with pytest.raises(typer.Exit) as exc_info:
+            fix._fix_available_parallel(store, None, 2, True, False, "main")
+
+        assert exc_info.value.exit_code == 1
+        assert processed == []
+        assert store.released == [("a/one", 1, "available")]
+
+    def test_tags_output_with_issue(
+        self,
+        processed: list,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test each worker's output lines name the issue they belong to."""
+        _budget_for(2, monkeypatch)
+        store = _IssueStore([("a/one", 1), ("b/two", 2)])
+
+        fix._fix_available_parallel(store, None, 2, True, False, "main")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "a/one#1 Phase 1: Analyzing issue..." in lines
+        assert "b/two#2 Phase 1: Analyzing issue..." in lines
+        assert "a/one#1 Issue #1 marked as completed" in lines
+
+
+class TestFixSingleIssue:
+    """Test fixing the next available issue."""
+
+    def test_releases_claim_without_budget(
+        self, processed: list, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an issue the budget can't cover is handed back unprocessed."""
+        _budget_for(0, monkeypatch)
+        store = _IssueStore([("a/one", 1)])
+        monkeypatch.setattr(issue_store, "IssueStore", lambda: store)
+        monkeypatch.setenv("GITHUB_TOKEN", "token")
+
+        with pytest.raises(typer.Exit) as exc_info:
+            fix.fix(
+                issue_url=None,
+                dry_run=True,
+                auto_merge=False,
+                branch="main",
+                parallel=1,
+            )
+
+        assert exc_info.value.exit_code == 1
+        assert processed == []
+        assert store.released == [("a/one", 1, "available")]
@@ -0,0 +1,36 @@
+"""Tests for GitHub client utilities - green path tests."""
+
+import time
+
+import pytest
+
+from globallm.github import GitHubClientPool, get_github_tokens
+
+
+class TestGetGithubTokens:
+    """Test token discovery from the environment."""
+
+    def test_prefers_token_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test GITHUB_TOKENS is split and takes precedence."""
+        monkeypatch.setenv("GITHUB_TOKENS", " a, b ,,c")
+        monkeypatch.setenv("GITHUB_TOKEN", "single")
+        assert get_github_tokens() == ["a", "b", "c"]
+
+    def test_falls_back_to_single_token(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test GITHUB_TOKEN is used when no pool is configured."""
+        monkeypatch.delenv("GITHUB_TOKENS", raising=False)
+        monkeypatch.setenv("GITHUB_TOKEN", "single")
+        assert get_github_tokens() == ["single"]
+
+
+class TestGitHubClientPool:
+    """Test client rotation."""
+
+    def test_skips_exhausted_clients(self) -> None:
+        """Test rotation passes over clients waiting for a rate limit reset."""
+        pool = GitHubClientPool(["a", "b", "c"])
+        first, second, third = pool.clients
+        second.requester.rate_limiting = (0, 5000)
+        second.requester.rate_limiting_resettime = time.time() + 60
+
+        assert [pool.next_client() for _ in range(4)] == [first, third, first, third]
@@ -0,0 +1,126 @@
+"""Tests for LLM issue analysis - green path tests."""
+
+import re
+from datetime import datetime
+from pathlib import Path
+
+from globallm.issues.analyzer import IssueAnalyzer
+from globallm.models.issue import Issue
+
+
+class _LLM:
+    """Answers every prompt with a fixed categorization.
+
+    Batch prompts are answered for all but the ``skip`` issue numbers.
+    """
+
+    model = "fake-model"
+
+    def __init__(self, skip: tuple[int, ...] = ()) -> None:
+        self.prompts: list[str] = []
+        self.skip = skip
+
+    def complete_json(self, prompt: str) -> dict:
+        self.prompts.append(prompt)
+        answer = {"category": "bug", "complexity": 3}
+        numbers = [int(n) for n in re.findall(r"^Issue #(\d+):", prompt, re.M)]
+        if numbers:
+            return {
+                "issues": [
+                    {"number": n, **answer} for n in numbers if n not in self.skip
+                ],
+                "tokens_used": 300,
+            }
+        return {**answer, "tokens_used": 120}
+
+
+def _issue(title: str, number: int = 1) -> Issue:
+    now = datetime(2025, 1, 1)
+    return Issue(
+        number=number,
+        title=title,
+        body="Steps to reproduce...",
+        author="reporter",
+        repository="owner/repo",
+        state="open",
+        created_at=now,
+        updated_at=now,
+        labels=["bug"],
+        assignees=[],
+        comments_count=0,
+        reactions={},
+    )
+
+
+class TestCategorizeIssue:
+    """Test issue categorization caching."""
+
+    def test_reuses_response_for_unchanged_issue(self, tmp_path: Path) -> None:
+        """Test an unchanged issue is answered from the cache at no token cost."""
+        llm = _LLM()
+        analyzer = IssueAnalyzer(llm, cache_dir=tmp_path)
+
+        first = analyzer.categorize_issue(_issue("Crash on start"))
+        second = analyzer.categorize_issue(_issue("Crash on start"))
+
+        assert len(llm.prompts) == 1
+        assert first.tokens_used == 120
+        assert second.tokens_used == 0
+        assert (second.category, second.complexity) == (
+            first.category,
+            first.complexity,
+        )
+
+    def test_changed_issue_asks_again(self, tmp_path: Path) -> None:
+        """Test an edited issue misses the cache."""
+        llm = _LLM()
+        analyzer = IssueAnalyzer(llm, cache_dir=tmp_path)
+
+        analyzer.categorize_issue(_issue("Crash on start"))
+        analyzer.categorize_issue(_issue("Crash on exit"))
+
+        assert len(llm.prompts) == 2
+
+
+class TestCategorizeIssuesBatched:
+    """Test batched issue categorization."""
+
+    def test_one_request_per_batch(self, tmp_path: Path) -> None:
+        """Test issues are sent batch_size at a time, one request per batch."""
+        llm = _LLM()
+        analyzer = IssueAnalyzer(llm, cache_dir=tmp_path, use_cache=False)
+        issues = [_issue(f"Issue {n}", number=n) for n in range(1, 6)]
+
+        analyses = analyzer.categorize_issues_batched(issues, batch_size=3)
+
+        assert len(llm.prompts) == 2
+        assert len(analyses) == 5
+        assert all(a.complexity == 3 for a in analyses)
+
+    def test_unanswered_issue_falls_back_to_single_prompt(self, tmp_path: Path) -> None:
+        """Test an issue left out of the batch answer is asked about alone."""
+        llm = _LLM(skip=(2,))
+        analyzer = IssueAnalyzer(llm, cache_dir=tmp_path, use_cache=False)
+        issues = [_issue(f"Issue {n}", number=n) for n in range(1, 4)]
+
+        analyses = analyzer.categorize_issues_batched(issues)
+
+        assert len(llm.prompts) == 2
+        assert "Issue #" not in llm.prompts[1]
+        assert [a.tokens_used for a in analyses] == [150, 120, 150]
+
+    def test_rerun_reuses_per_issue_answers(self, tmp_path: Path) -> None:
+        """Test an inserted issue doesn't make the other issues miss the cache."""
+        llm = _LLM()
+        analyzer = IssueAnalyzer(llm, cache_dir=tmp_path)
+        issues = [_issue(f"Issue {n}", number=n) for n in range(1, 6)]
+        analyzer.categorize_issues_batched(issues, batch_size=3)
+        llm.prompts.clear()
+
+        analyses = analyzer.categorize_issues_batched(
+            [_issue("Issue 99", number=99), *issues], batch_size=3
+        )
+
+        assert len(llm.prompts) == 1
+        assert "Issue 99" in llm.prompts[0]
+        assert [a.tokens_used for a in analyses] == [120, 0, 0, 0, 0, 0]
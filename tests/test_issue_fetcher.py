@@ -0,0 +1,63 @@
+"""Tests for issue fetching - green path tests."""
+
+from pathlib import Path
+
+from github import Github
+
+from globallm.issues.fetcher import IssueFetcher
+
+_ISSUE = {
+    "number": 7,
+    "title": "Crash on start",
+    "body": "Steps to reproduce...",
+    "user": {"login": "reporter"},
+    "state": "open",
+    "created_at": "2025-01-01T00:00:00Z",
+    "updated_at": "2025-01-02T00:00:00Z",
+    "labels": [{"name": "bug"}],
+    "assignees": [],
+    "comments": 2,
+}
+
+
+class _Requester:
+    """Answers issue requests, honouring If-None-Match."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str | None]] = []
+
+    def requestJsonAndCheck(self, verb, url, headers=None):
+        etag = (headers or {}).get("If-None-Match")
+        self.requests.append((url, etag))
+        if etag == '"v1"':
+            return {}, None
+        return {"etag": '"v1"'}, _ISSUE
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.requester = _Requester()
+        self._github = Github()
+
+    def create_from_raw_data(self, klass, raw_data, headers):
+        return self._github.create_from_raw_data(klass, raw_data, headers)
+
+
+class TestFetchSingleIssue:
+    """Test single issue fetching."""
+
+    def test_revalidates_cached_issue_with_etag(self, tmp_path: Path) -> None:
+        """Test a refetch sends the cached ETag and reuses the payload on 304."""
+        client = _Client()
+        fetcher = IssueFetcher(client, cache_dir=tmp_path)
+
+        first = fetcher.fetch_single_issue("owner/repo", 7)
+        second = fetcher.fetch_single_issue("owner/repo", 7)
+
+        assert client.requester.requests == [
+            ("/repos/owner/repo/issues/7", None),
+            ("/repos/owner/repo/issues/7", '"v1"'),
+        ]
+        assert second == first
+        assert second.title == "Crash on start"
+        assert second.labels == ["bug"]
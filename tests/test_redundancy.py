@@ -0,0 +1,96 @@
+"""Tests for redundancy detection - green path tests."""
+
+import numpy as np
+
+from globallm.analysis.redundancy import RedundancyDetector, _lsh_rows_per_band
+
+
+def _word_overlap_detector() -> RedundancyDetector:
+    """Create a detector that uses the word-overlap fallback."""
+    detector = RedundancyDetector()
+    detector._embedder = False
+    return detector
+
+
+class TestCandidatePairs:
+    """Test README candidate pair generation."""
+
+    def test_near_duplicates_are_candidates(self) -> None:
+        """Test near-identical READMEs are paired and unrelated ones are not."""
+        base = " ".join(f"word{n}" for n in range(200))
+        readmes = [
+            base,
+            base + " extra",
+            " ".join(f"other{n}" for n in range(200)),
+        ]
+        detector = _word_overlap_detector()
+
+        assert detector.candidate_pairs(readmes, 0.75) == [(0, 1)]
+
+    def test_size_ratio_bounds_similarity(self) -> None:
+        """Test pairs whose word counts rule out the threshold are dropped."""
+        base = " ".join(f"word{n}" for n in range(40))
+        longer = base + " " + " ".join(f"more{n}" for n in range(120))
+        detector = _word_overlap_detector()
+
+        # Jaccard is exactly 40/160 = 0.25
+        assert detector.candidate_pairs([base, longer], 0.2) == [(0, 1)]
+        assert detector.candidate_pairs([base, longer], 0.3) == []
+
+    def test_empty_readmes_are_skipped(self) -> None:
+        """Test repos without a README never form a pair."""
+        detector = _word_overlap_detector()
+        assert detector.candidate_pairs(["", "some text", ""], 0.5) == []
+
+    def test_all_pairs_with_embedder(self) -> None:
+        """Test every pair is returned when embeddings are in use."""
+        detector = RedundancyDetector()
+        detector._embedder = object()
+        assert detector.candidate_pairs(["a", "b", "c"], 0.9) == [
+            (0, 1),
+            (0, 2),
+            (1, 2),
+        ]
+
+    def test_band_width_keeps_recall(self) -> None:
+        """Test the chosen band width keeps pairs at the threshold."""
+        rows = _lsh_rows_per_band(0.75)
+        bands = 128 // rows
+        assert 1 - (1 - 0.75**rows) ** bands >= 0.99
+
+
+class TestReadmePairSimilarities:
+    """Test batched README similarity."""
+
+    def test_matches_single_pair_similarity(self) -> None:
+        """Test batched scores equal pair-by-pair scores."""
+        readmes = ["a b c d", "a b c e", "", "x y z"]
+        pairs = [(0, 1), (0, 2), (1, 3)]
+        detector = _word_overlap_detector()
+
+        assert detector.readme_pair_similarities(readmes, pairs) == [
+            detector.compute_readme_similarity(readmes[i], readmes[j]) for i, j in pairs
+        ]
+
+    def test_embeddings_match_single_pair_similarity(self) -> None:
+        """Test batched embedding scores equal pair-by-pair cosine scores."""
+
+        class _Embedder:
+            def encode(self, texts, convert_to_numpy=True):
+                def vector(text):
+                    return np.array([len(text), text.count("a"), 1.0])
+
+                if isinstance(texts, str):
+                    return vector(texts)
+                return np.array([vector(text) for text in texts])
+
+        readmes = ["aaa b", "a bb", "", "ccc"]
+        pairs = [(0, 1), (0, 2), (1, 3), (0, 3)]
+        detector = RedundancyDetector()
+        detector._embedder = _Embedder()
+
+        batched = detector.readme_pair_similarities(readmes, pairs)
+        single = [
+            detector.compute_readme_similarity(readmes[i], readmes[j]) for i, j in pairs
+        ]
+        assert np.allclose(batched, single)
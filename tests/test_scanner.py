@@ -0,0 +1,72 @@
+"""Tests for the GitHub scanner - green path tests."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from globallm.scanner import GitHubScanner
+
+_REPO = {
+    "full_name": "owner/repo",
+    "stargazers_count": 10,
+    "forks_count": 2,
+    "open_issues_count": 1,
+    "watchers_count": 3,
+    "language": "Python",
+}
+
+
+class _Requester:
+    """Answers repository requests, honouring If-None-Match."""
+
+    def __init__(self) -> None:
+        self.sent_etags: list[str | None] = []
+
+    def requestJsonAndCheck(self, verb, url, headers=None):
+        etag = (headers or {}).get("If-None-Match")
+        self.sent_etags.append(etag)
+        if etag == '"v1"':
+            return {}, None
+        return {"etag": '"v1"'}, _REPO
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.requester = _Requester()
+
+    def create_from_raw_data(self, klass, raw_data, headers):
+        return SimpleNamespace(**raw_data, etag=headers.get("etag"))
+
+
+class TestAnalyzeRepo:
+    """Test repository analysis caching."""
+
+    def test_revalidates_expired_entry_with_etag(self, tmp_path: Path) -> None:
+        """Test an expired entry is renewed by a 304 instead of refetched."""
+        client = _Client()
+        scanner = GitHubScanner(client, cache_dir=tmp_path, cache_ttl_hours=0)
+
+        first = scanner.analyze_repo("owner/repo")
+        second = scanner.analyze_repo("owner/repo")
+
+        assert client.requester.sent_etags == [None, '"v1"']
+        assert second == first
+        assert second.stars == 10
+
+
+class TestFromTokens:
+    """Test building a scanner from configured tokens."""
+
+    def test_pool_client_is_the_scanners_own(self, tmp_path: Path) -> None:
+        """Test several tokens share clients with the pool, one per token."""
+        scanner = GitHubScanner.from_tokens(["token-a", "token-b"], cache_dir=tmp_path)
+
+        assert scanner._pool is not None
+        assert len(scanner._pool) == 2
+        assert scanner._github is scanner._pool.clients[0]
+
+    def test_single_token_has_no_pool(self, tmp_path: Path) -> None:
+        """Test one token gives a single client and no rotation."""
+        scanner = GitHubScanner.from_tokens(["token-a"], cache_dir=tmp_path)
+
+        assert scanner._pool is None
+        assert scanner.github is scanner._github